@@ -1,9 +1,10 @@
 import pygame
 import random
 import math
-import noise
 import sys # NEW: Import sys module
 import os # NEW: Import os module
+import ctypes # NEW: For byte offsets into interleaved vertex buffers
+from collections import deque # NEW: O(1) pops for the controlled burn flood fill
 
 # NEW: Helper function to get resource path for PyInstaller
 def resource_path(relative_path):
@@ -18,9 +19,17 @@ def resource_path(relative_path):
 
 # NEW: Import OpenGL libraries
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from OpenGL.GL.shaders import compileShader # NEW: For the instanced billboard shader
 import numpy as np
 
+# NEW: Numba is optional. When installed, the fire simulation kernels are JIT-compiled,
+# otherwise the vectorized NumPy code paths are used.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Initialize Pygame
 pygame.init()
 
@@ -86,131 +95,511 @@ FIRE = 7
 CONTROLLED_BURN = 8
 
 # Flammability (remains the same)
-FLAMMABILITY = {
-    FOREST_DENSE: 0.8, FOREST_LIGHT: 0.6, GRASSLAND: 0.4, FIELD: 0.3,
-    HOUSE: 0.9, WATER: 0.0, BURNT: 0.0, FIRE: 1.0, CONTROLLED_BURN: 1.0
-}
+# NEW: Stored as a lookup table indexed by cell state instead of a dict, so a single cell
+# is one array load and the flammability of a whole grid is a single gather: FLAMMABILITY_LUT[grid]
+FLAMMABILITY_LUT = np.zeros(9, dtype=np.float32)
+FLAMMABILITY_LUT[FOREST_DENSE] = 0.8
+FLAMMABILITY_LUT[FOREST_LIGHT] = 0.6
+FLAMMABILITY_LUT[GRASSLAND] = 0.4
+FLAMMABILITY_LUT[FIELD] = 0.3
+FLAMMABILITY_LUT[HOUSE] = 0.9
+FLAMMABILITY_LUT[WATER] = 0.0
+FLAMMABILITY_LUT[BURNT] = 0.0
+FLAMMABILITY_LUT[FIRE] = 1.0
+FLAMMABILITY_LUT[CONTROLLED_BURN] = 1.0
+
+# NEW: Cells that can still catch fire (not water and not already burning or burnt), indexed by cell state
+# like FLAMMABILITY_LUT: IS_BURNABLE[state] for one cell, IS_BURNABLE[grid] for a whole-grid mask
+IS_BURNABLE = np.zeros(9, dtype=np.bool_)
+IS_BURNABLE[FOREST_DENSE] = True
+IS_BURNABLE[FOREST_LIGHT] = True
+IS_BURNABLE[GRASSLAND] = True
+IS_BURNABLE[FIELD] = True
+IS_BURNABLE[HOUSE] = True
+
+# NEW: Particle system constants
+MAX_PARTICLES = 4096 # Capacity of the preallocated particle arrays and VBO
+# Colors are stored pre-divided into OpenGL's 0..1 range
+PARTICLE_START_COLORS = np.array(((180, 60, 0), (180, 20, 0)), dtype=np.float32) / 255.0 # Bright yellow/orange
+PARTICLE_END_COLOR = np.array((40, 40, 40), dtype=np.float32) / 255.0 # Dark smoke
+# NEW: Particle vertex and instance layouts; colors are normalized RGBA bytes rather than floats
+PARTICLE_VERTEX = np.dtype([('pos', 'f4', 3), ('color', 'u1', 4)]) # 16 bytes
+PARTICLE_INSTANCE = np.dtype([('pos', 'f4', 4), ('color', 'u1', 4)]) # 20 bytes: x, y, z, size, then RGBA
+
+# NEW: Chance multiplier for fire jumping to a neighboring cell (scaled by its flammability)
+FIRE_SPREAD_CHANCE = 0.39 # Increased from 0.325 to further increase spread by ~20%
 
 # NEW: Constants for fire aging and ash transition
 MAX_ASH_TIMER = 420 # How many updates before fire turns to ash
+# NEW: Burning cell colors, fading from red to dark ash, indexed by int(fade * 255)
+FIRE_FADE_LUT = (np.array(RED) * (1.0 - np.linspace(0.0, 1.0, 256))[:, None]
+                 + 50 * np.linspace(0.0, 1.0, 256)[:, None]).astype(np.uint8)
+
+# NEW: Gradient directions for 2D Perlin noise (x/y of the classic 16 hashed gradients)
+NOISE_GRADIENTS = np.array([(1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (1, 0), (-1, 0),
+                            (0, 1), (0, -1), (0, 1), (0, -1), (1, 0), (-1, 0), (0, -1), (0, 1)], dtype=np.float32)
+
+# NEW: A random doubled permutation table; each table plays the role of one noise "base"
+def noise_permutation():
+    return np.tile(np.random.permutation(256), 2)
+
+# NEW: Vectorized 2D Perlin noise over whole coordinate arrays (same algorithm as noise.pnoise2)
+def perlin2(x, y, perm):
+    xi = np.floor(x).astype(np.intp)
+    yi = np.floor(y).astype(np.intp)
+    xf = (x - xi).astype(np.float32)
+    yf = (y - yi).astype(np.float32)
+    u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+    v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+
+    i, j = xi & 255, yi & 255
+    ii, jj = (i + 1) & 255, (j + 1) & 255
+    a, b = perm[i], perm[ii]
+
+    def grad(hash_index, gx, gy):
+        g = NOISE_GRADIENTS[perm[hash_index] & 15]
+        return gx * g[..., 0] + gy * g[..., 1]
+
+    # Gradient contribution of each cell corner, each gathered exactly once
+    n00 = grad(a + j, xf, yf)
+    n10 = grad(b + j, xf - 1, yf)
+    n01 = grad(a + jj, xf, yf - 1)
+    n11 = grad(b + jj, xf - 1, yf - 1)
+
+    x1 = n00 + u * (n10 - n00)
+    x2 = n01 + u * (n11 - n01)
+    return x1 + v * (x2 - x1)
+
+# NEW: Sum octaves of perlin2 and normalize, like pnoise2's octaves/persistence/lacunarity
+def fractal_noise2(x, y, perm, octaves=1, persistence=0.5, lacunarity=2.0):
+    total = np.zeros(np.shape(x), dtype=np.float32)
+    freq, amp, max_amp = 1.0, 1.0, 0.0
+    for _ in range(octaves):
+        total += perlin2(x * freq, y * freq, perm) * amp
+        max_amp += amp
+        freq *= lacunarity
+        amp *= persistence
+    return total / max_amp
+
+# NEW: Projection matrices built on the CPU and loaded with glLoadMatrixf. Arrays are stored
+# column-major (as OpenGL expects), so m[column, row].
+# Same matrix as gluPerspective
+def perspective_matrix(fovy, aspect, z_near, z_far):
+    f = 1.0 / math.tan(math.radians(fovy) / 2)
+    m = np.zeros((4, 4), dtype=np.float32)
+    m[0, 0] = f / aspect
+    m[1, 1] = f
+    m[2, 2] = (z_far + z_near) / (z_near - z_far)
+    m[2, 3] = -1.0
+    m[3, 2] = 2 * z_far * z_near / (z_near - z_far)
+    return m
+
+# Same matrix as gluOrtho2D
+def ortho_matrix(left, right, bottom, top):
+    m = np.identity(4, dtype=np.float32)
+    m[0, 0] = 2.0 / (right - left)
+    m[1, 1] = 2.0 / (top - bottom)
+    m[2, 2] = -1.0
+    m[3, 0] = -(right + left) / (right - left)
+    m[3, 1] = -(top + bottom) / (top - bottom)
+    return m
+
+# NEW: Orbit camera modelview, the same matrix as glTranslatef(0, 0, distance); glRotatef(pitch, 1, 0, 0);
+# glRotatef(yaw, 0, 1, 0), built on the CPU so it never has to be read back from OpenGL
+def camera_matrix(distance, pitch, yaw):
+    cp, sp = math.cos(math.radians(pitch)), math.sin(math.radians(pitch))
+    cy, sy = math.cos(math.radians(yaw)), math.sin(math.radians(yaw))
+    return np.array([[cy, sp * sy, -cp * sy, 0.0],
+                     [0.0, cp, sp, 0.0],
+                     [sy, -sp * cy, cp * cy, 0.0],
+                     [0.0, 0.0, distance, 1.0]], dtype=np.float32)
+
+# NEW: The 6 view frustum planes (a, b, c, d) of a column-major view-projection matrix, normalized so
+# a·x + b·y + c·z + d is the signed distance of a world point from each plane (positive inside)
+def frustum_planes(view_projection):
+    rows = view_projection.T
+    planes = np.array([rows[3] + rows[0], rows[3] - rows[0], rows[3] + rows[1],
+                       rows[3] - rows[1], rows[3] + rows[2], rows[3] - rows[2]])
+    return planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+# 2D projection for the PSX blit, which always covers the base window size
+PSX_BLIT_MATRIX = ortho_matrix(0, WINDOW_WIDTH, WINDOW_HEIGHT, 0)
+
+# NEW: Instanced billboard shader. One unit quad is drawn once per sprite; each instance supplies
+# its position, size, tint and the sprite's rectangle in the shared texture atlas.
+BILLBOARD_VERTEX_SHADER = """
+#version 120
+attribute vec2 corner;       // Unit quad corner: x across the sprite, y up from its base
+attribute vec3 sprite_pos;   // Base center of the sprite in world space
+attribute vec3 sprite_size;  // Width, height, tint
+attribute vec3 sprite_uv;    // u0, u1, v1 of the sprite in the atlas (v0 is always 0)
+uniform vec3 camera_right;
+varying vec2 uv;
+varying float tint;
+void main() {
+    vec3 world = sprite_pos + camera_right * ((corner.x - 0.5) * sprite_size.x) + vec3(0.0, corner.y * sprite_size.y, 0.0);
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(world, 1.0);
+    uv = vec2(mix(sprite_uv.x, sprite_uv.y, corner.x), corner.y * sprite_uv.z);
+    tint = sprite_size.z;
+}
+"""
+
+BILLBOARD_FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D atlas;
+varying vec2 uv;
+varying float tint;
+void main() {
+    vec4 texel = texture2D(atlas, uv);
+    gl_FragColor = vec4(texel.rgb * tint, texel.a);
+}
+"""
+
+# NEW: Instanced particle shader. Each instance is a point (position, size, color) that the
+# vertex shader expands into a camera-facing quad.
+PARTICLE_VERTEX_SHADER = """
+#version 120
+attribute vec2 corner;          // Unit quad corner
+attribute vec4 particle_pos;    // Center in world space, size
+attribute vec4 particle_color;  // RGB, alpha
+uniform vec3 camera_right;
+uniform vec3 camera_up;
+varying vec4 color;
+void main() {
+    vec3 offset = camera_right * (corner.x - 0.5) + camera_up * (corner.y - 0.5);
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(particle_pos.xyz + offset * particle_pos.w, 1.0);
+    color = particle_color;
+}
+"""
 
-# NEW: Particle class for fire effects
-class Particle:
-    def __init__(self, x, z):
-        self.pos = np.array([x, 0.5, z], dtype=float)
-        self.vel = np.array([random.uniform(-0.02, 0.02),
-                             random.uniform(0.05, 0.1),
-                             random.uniform(-0.02, 0.02)], dtype=float)
-        self.lifetime = random.randint(100, 200)
-        self.max_lifetime = self.lifetime
-        self.size = random.uniform(0.3, 0.6)
-        # Start as bright yellow/orange, fade to dark smoke
-        self.start_color = random.choice([(180, 60, 0), (180, 20, 0)])
-        self.end_color = (40, 40, 40)
-
-    def update(self, dt):
-        self.pos += self.vel * dt * 60 # Scale movement by dt
-        self.vel[1] *= (0.99 ** (dt * 60)) # Slow down upward movement (gravity/drag) adjusted by dt
-        self.lifetime -= dt * 60 # Decrease lifetime by dt
-
-    def get_color(self):
-        fade_factor = self.lifetime / self.max_lifetime
-        # Fade from start color to end color
-        r = int(self.start_color[0] * fade_factor + self.end_color[0] * (1 - fade_factor))
-        g = int(self.start_color[1] * fade_factor + self.end_color[1] * (1 - fade_factor))
-        b = int(self.start_color[2] * fade_factor + self.end_color[2] * (1 - fade_factor))
-        # Alpha fades out
-        a = fade_factor
-        return (r/255.0, g/255.0, b/255.0, a)
+PARTICLE_FRAGMENT_SHADER = """
+#version 120
+varying vec4 color;
+void main() {
+    gl_FragColor = color;
+}
+"""
+
+# NEW: Bufferless full-screen blit (PSX framebuffer, cached pause menu). Three vertices with no attributes
+# form one triangle that covers the whole viewport; its corners and texture coordinates come from
+# gl_VertexID, so no VBO or matrices are needed.
+BLIT_VERTEX_SHADER = """
+#version 130
+out vec2 uv;
+void main() {
+    vec2 p = vec2((gl_VertexID << 1) & 2, gl_VertexID & 2);
+    uv = p;
+    gl_Position = vec4(p * 2.0 - 1.0, 0.0, 1.0);
+}
+"""
+
+BLIT_FRAGMENT_SHADER = """
+#version 130
+uniform sampler2D screen;
+in vec2 uv;
+void main() {
+    gl_FragColor = texture(screen, uv);
+}
+"""
+
+# NEW: Vertex order that splits a quad (corners 0, 1, 2, 3 in winding order) into two triangles.
+# Quads are drawn as triangles rather than GL_QUADS, which many drivers only emulate.
+QUAD_TRIANGLES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+
+# NEW: Compile and link a shader program. Linked by hand so the per-vertex "corner" attribute is
+# attribute 0, which compatibility contexts require for instanced draws.
+def link_program(vertex_source, fragment_source):
+    program = glCreateProgram()
+    glAttachShader(program, compileShader(vertex_source, GL_VERTEX_SHADER))
+    glAttachShader(program, compileShader(fragment_source, GL_FRAGMENT_SHADER))
+    glBindAttribLocation(program, 0, "corner")
+    glLinkProgram(program)
+    if glGetProgramiv(program, GL_LINK_STATUS) != GL_TRUE:
+        raise RuntimeError(glGetProgramInfoLog(program))
+    return program
+
+# NEW: Triangle fan of a unit circle (center, then 20 rim points closing the loop) for the volume slider thumb
+THUMB_FAN = np.array([(0.0, 0.0)] + [(math.cos(2 * math.pi * i / 19), math.sin(2 * math.pi * i / 19)) for i in range(20)], dtype=np.float32)
+
+# NEW: (dx, dy) offsets of a cell's 8 neighbors, for the remaining per-cell Python loops
+NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+# NEW: Chance of a river spilling into each neighbor of its course, lower for diagonal neighbors
+RIVER_SPLASH_CHANCE = np.array([0.6 / (abs(dx) + abs(dy) + 0.5) for dx, dy in NEIGHBOR_OFFSETS])
+
+# NEW: Count, for every cell, how many of its 8 neighbors are set in a boolean grid mask
+def count_neighbors(mask):
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    counts[1:, :] += mask[:-1, :]
+    counts[:-1, :] += mask[1:, :]
+    counts[:, 1:] += mask[:, :-1]
+    counts[:, :-1] += mask[:, 1:]
+    counts[1:, 1:] += mask[:-1, :-1]
+    counts[1:, :-1] += mask[:-1, 1:]
+    counts[:-1, 1:] += mask[1:, :-1]
+    counts[:-1, :-1] += mask[1:, 1:]
+    return counts
+
+# NEW: JIT-compiled fire spread step, equivalent to the NumPy path in FireGame.spread_fire.
+# Reads only the pre-step grid so fires lit this step don't spread further until the next one.
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def step_fire(grid, burnt_timers, flam_lut, spread_factor, rand_buf):
+        height, width = grid.shape
+        ignite = np.zeros((height, width), dtype=np.bool_)
+        for y in prange(height):
+            for x in range(width):
+                state = grid[y, x]
+                if not IS_BURNABLE[state]:
+                    continue
+                burning = 0
+                for ny in range(max(0, y - 1), min(height, y + 2)):
+                    for nx in range(max(0, x - 1), min(width, x + 2)):
+                        if grid[ny, nx] == FIRE:
+                            burning += 1
+                if burning > 0 and rand_buf[y, x] < 1.0 - (1.0 - flam_lut[state] * spread_factor) ** burning:
+                    ignite[y, x] = True
+
+        new_fires = 0
+        for y in range(height):
+            for x in range(width):
+                if ignite[y, x]:
+                    grid[y, x] = FIRE
+                    burnt_timers[y, x] = 0.0
+                    new_fires += 1
+        return new_fires
+
+    # NEW: Compact live particles to the front and advance them in one pass, returns the new live count
+    @njit('i8(f4[:, ::1], f4[:, ::1], f4[::1], f4[::1], f4[::1], f4[:, ::1], i8, f8, f8)', cache=True, fastmath=True)
+    def step_particles(pos, vel, life, max_life, size, start_col, count, step, drag):
+        live = 0
+        for i in range(count):
+            if life[i] <= 0:
+                continue
+            if live != i:
+                for k in range(3):
+                    pos[live, k] = pos[i, k]
+                    vel[live, k] = vel[i, k]
+                    start_col[live, k] = start_col[i, k]
+                life[live] = life[i]
+                max_life[live] = max_life[i]
+                size[live] = size[i]
+            for k in range(3):
+                pos[live, k] += vel[live, k] * step
+            vel[live, 1] *= drag
+            life[live] -= step
+            live += 1
+        return live
+
+    # NEW: JIT-compiled fire aging, equivalent to the NumPy path in FireGame.age_fire. Burning cells
+    # advance their timer and turn to ash, with a random ash shade, once it runs out.
+    @njit(cache=True, fastmath=True)
+    def step_age_fire(grid, burnt_timers, ash_colors, step):
+        height, width = grid.shape
+        for y in range(height):
+            for x in range(width):
+                if grid[y, x] != FIRE:
+                    continue
+                burnt_timers[y, x] += step
+                if burnt_timers[y, x] >= MAX_ASH_TIMER:
+                    grid[y, x] = BURNT
+                    burnt_timers[y, x] = 0.0
+                    ash_colors[y, x] = np.random.randint(50, 71)
 
 ### NEW ###
-# Class to manage individual tree sprites
+# Tree sprite states and size. The per-tree data lives in FireGame's tree_* arrays.
 class Tree:
     # States for animation
     NORMAL = 0
     BURNING = 1
     BURNT = 2
 
-    def __init__(self, grid_x, grid_y):
-        # Add a random offset so trees aren't perfectly centered in grid cells
-        offset_x = random.uniform(-0.3, 0.3)
-        offset_z = random.uniform(-0.3, 0.3)
-        self.pos = np.array([
-            grid_x - GRID_WIDTH / 2 + 0.5 + offset_x,
-            0.0,  # Base of the tree is on the ground plane (y=0)
-            grid_y - GRID_HEIGHT / 2 + 0.5 + offset_z
-        ], dtype=float)
-        self.grid_x = grid_x
-        self.grid_y = grid_y
-        self.state = self.NORMAL
-        self.animation_timer = 0
-        # Frame indices will map to the loaded texture list:
-        # 0: normal, 1-3: burning animation, 4: burnt
-        self.current_frame_index = 0
-        self.height = 3.5  # Adjust size as needed
-        self.width = 2.5   # Adjust size as needed
-
-    # NEW: Method to return current texture ID for unified drawing
-    def get_texture_id(self, game_instance):
-        return game_instance.tree_textures[self.current_frame_index]
-    
-    # NEW: Method to return dimensions for unified drawing
-    def get_dimensions(self):
-        return self.width, self.height
+    # Frame indices map to the loaded texture list:
+    # 0: normal, 1-3: burning animation, 4: burnt
+    HEIGHT = 3.5  # Adjust size as needed
+    WIDTH = 2.5   # Adjust size as needed
 
 ### NEW ###
-# Class to manage individual field grass sprites
+# Field grass sprite size. The per-sprite data lives in FireGame's fieldgrass_* arrays.
 class FieldGrass:
     NORMAL = 0
 
-    def __init__(self, grid_x, grid_y):
-        offset_x = random.uniform(-0.4, 0.4)
-        offset_z = random.uniform(-0.4, 0.4)
-        self.pos = np.array([
-            grid_x - GRID_WIDTH / 2 + 0.5 + offset_x,
-            0.0,
-            grid_y - GRID_HEIGHT / 2 + 0.5 + offset_z
-        ], dtype=float)
-        self.grid_x = grid_x
-        self.grid_y = grid_y
-        self.state = self.NORMAL
-        self.height = 0.8 # Smaller than trees
-        self.width = 0.8  # Smaller than trees
-
-    # NEW: Method to return current texture ID for unified drawing
-    def get_texture_id(self, game_instance):
-        # Field grass only has one texture
-        return game_instance.fieldgrass_texture
-
-    # NEW: Method to return dimensions for unified drawing
-    def get_dimensions(self):
-        return self.width, self.height
+    HEIGHT = 0.8 # Smaller than trees
+    WIDTH = 0.8  # Smaller than trees
 
 ### NEW ###
-# Class to manage individual house sprites
+# House sprite states and size. The per-house data lives in FireGame's house_* arrays.
 class HouseSprite:
     NORMAL = 0
     BURNT = 1
 
-    def __init__(self, grid_x, grid_y):
-        self.pos = np.array([
-            grid_x - GRID_WIDTH / 2 + 0.5,
-            0.0, # Houses sit on the ground
-            grid_y - GRID_HEIGHT / 2 + 0.5
-        ], dtype=float)
-        self.grid_x = grid_x
-        self.grid_y = grid_y
-        self.state = self.NORMAL
-        self.height = 1.8 # Reduced further from 2.5
-        self.width = 1.8  # Reduced further from 2.5
-
-    # NEW: Method to return current texture ID for unified drawing
-    def get_texture_id(self, game_instance):
-        return game_instance.house_textures[self.state]
-
-    # NEW: Method to return dimensions for unified drawing
-    def get_dimensions(self):
-        return self.width, self.height
+    HEIGHT = 1.8 # Reduced further from 2.5
+    WIDTH = 1.8  # Reduced further from 2.5
+
+# NEW: World-space base positions (on the y=0 ground plane) for sprites standing in grid cells.
+# `cells` is an (N, 2) array of (grid_x, grid_y); `offsets` optionally shifts each sprite in x/z.
+def sprite_positions(cells, offsets=None):
+    positions = np.zeros((len(cells), 3), dtype=np.float32)
+    positions[:, 0] = cells[:, 0] - GRID_WIDTH / 2 + 0.5
+    positions[:, 2] = cells[:, 1] - GRID_HEIGHT / 2 + 0.5
+    if offsets is not None:
+        positions[:, 0] += offsets[:, 0]
+        positions[:, 2] += offsets[:, 1]
+    return positions
+
+# NEW: (N, 2) array holding the same (width, height) for every sprite of one type
+def sprite_dimensions(count, width, height):
+    return np.tile(np.array([width, height], dtype=np.float32), (count, 1))
+
+# NEW: Index sprites by the grid cell they stand on, as (sprite indices sorted by flat cell index,
+# start of each cell's run in that order); a cell may hold any number of sprites
+def cell_sprite_lookup(cells):
+    flat = cells[:, 1] * GRID_WIDTH + cells[:, 0]
+    order = np.argsort(flat, kind='stable')
+    starts = np.searchsorted(flat[order], np.arange(GRID_HEIGHT * GRID_WIDTH + 1))
+    return order, starts
+
+# NEW: Indices of the sprites standing on the given flat cell indices
+def sprites_on_cells(lookup, cells):
+    order, starts = lookup
+    first, counts = starts[cells], starts[cells + 1] - starts[cells]
+    runs = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    return order[runs]
+
+# NEW: Upload a pygame surface into a new OpenGL texture, returns (texid, width, height)
+def surface_to_texture(surface):
+    textureData = pygame.image.tostring(surface, "RGBA", True)
+    width = surface.get_width()
+    height = surface.get_height()
+
+    texid = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texid)
+
+    # --- FIX FOR BLURRY TEXTURES ---
+    # Use GL_NEAREST to get a sharp, pixelated look instead of a blurry one.
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+
+    # Upload the texture data.
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, textureData)
+    return texid, width, height
+
+### NEW: Font atlas so HUD text is drawn as textured quads instead of glDrawPixels
+class GlyphAtlas:
+    def __init__(self, font):
+        # Render every printable ASCII character once, side by side in a single texture.
+        # Glyphs are white and get tinted with glColor when drawn.
+        chars = [chr(code) for code in range(32, 127)]
+        glyphs = [font.render(char, True, WHITE) for char in chars]
+        self.height = font.get_height()
+        atlas = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+
+        # Atlas x offset and width of each glyph, indexed by character code (unknown codes stay 0 wide)
+        self.glyph_x = np.zeros(128, dtype=np.float32)
+        self.glyph_w = np.zeros(128, dtype=np.float32)
+        x = 0
+        for char, glyph in zip(chars, glyphs):
+            atlas.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX) # Copy the glyph without blending
+            self.glyph_x[ord(char)] = x
+            self.glyph_w[ord(char)] = glyph.get_width()
+            x += glyph.get_width()
+
+        self.texture, self.width, _ = surface_to_texture(atlas)
+        self.vbo = glGenBuffers(1)
+        self.quad_cache = {} # NEW: Vertex quads of recently drawn lines, keyed by (x, y, text)
+
+    def char_codes(self, text):
+        return np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8)
+
+    def text_width(self, text):
+        return int(self.glyph_w[self.char_codes(text)].sum())
+
+    # Draw a line of text with its top-left corner at (x, y) in 2D screen coordinates
+    def draw(self, x, y, text, color=WHITE):
+        self.draw_lines(((x, y, text),), color)
+
+    # NEW: Draw several (x, y, text) lines of the same color with a single upload and draw call
+    def draw_lines(self, lines, color=WHITE):
+        quads = [self.line_quads(x, y, text) for x, y, text in lines]
+        quads = quads[0] if len(quads) == 1 else np.concatenate(quads)
+        if len(quads) == 0:
+            return
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, quads.nbytes, quads, GL_STREAM_DRAW)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glColor4f(color[0] / 255.0, color[1] / 255.0, color[2] / 255.0, 1.0)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 16, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, 16, ctypes.c_void_p(8))
+        glDrawArrays(GL_TRIANGLES, 0, len(quads) * 6)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisable(GL_TEXTURE_2D)
+
+    # NEW: HUD lines mostly repeat from frame to frame, so their quads are built once and reused
+    def line_quads(self, x, y, text):
+        quads = self.quad_cache.get((x, y, text))
+        if quads is None:
+            quads = self.build_quads(x, y, text)
+            if len(self.quad_cache) >= 64: # Changing text (score, volume) would otherwise grow it forever
+                self.quad_cache.clear()
+            self.quad_cache[(x, y, text)] = quads
+        return quads
+
+    # One quad of (x, y, u, v) vertices per character, split into triangles; texture data is stored bottom-up
+    def build_quads(self, x, y, text):
+        codes = self.char_codes(text)
+        widths = self.glyph_w[codes]
+        left = x + np.cumsum(widths) - widths
+        u0 = self.glyph_x[codes] / self.width
+        u1 = u0 + widths / self.width
+
+        quads = np.empty((len(codes), 4, 4), dtype='f4')
+        quads[:, 0] = np.stack((left, np.full_like(left, y), u0, np.ones_like(u0)), axis=1)
+        quads[:, 1] = np.stack((left + widths, np.full_like(left, y), u1, np.ones_like(u0)), axis=1)
+        quads[:, 2] = np.stack((left + widths, np.full_like(left, y + self.height), u1, np.zeros_like(u0)), axis=1)
+        quads[:, 3] = np.stack((left, np.full_like(left, y + self.height), u0, np.zeros_like(u0)), axis=1)
+        return quads[:, QUAD_TRIANGLES] # NEW: Two triangles per character instead of GL_QUADS
+
+### NEW: A pre-rendered 2D overlay (menu screens). The overlay is drawn once into a window-sized RGBA
+# texture and only redrawn when its key, which records everything the overlay shows, changes.
+class OverlayCache:
+    def __init__(self):
+        self.fbo = 0
+        self.texture = 0
+        self.size = None
+        self.key = None
+
+    # Make sure the texture shows `key`, calling render(size) inside the overlay's FBO if it does not
+    def update(self, key, size, render):
+        if key == self.key:
+            return
+        if not self.fbo:
+            self.fbo = glGenFramebuffers(1)
+            self.texture = glGenTextures(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        if self.size != size:
+            glBindTexture(GL_TEXTURE_2D, self.texture)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, size[0], size[1], 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+            glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.texture, 0)
+            self.size = size
+
+        glPushAttrib(GL_COLOR_BUFFER_BIT | GL_VIEWPORT_BIT)
+        glViewport(0, 0, size[0], size[1])
+        glClearColor(0.0, 0.0, 0.0, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT)
+        # Accumulate alpha as "over" does, which leaves the color channels premultiplied
+        glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+        render(size)
+        glPopAttrib()
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        self.key = key
 
 ### NEW: Button class for stylized menu buttons
 class MenuButton:
@@ -220,9 +609,15 @@ class MenuButton:
         self.font = font
         self.hovered = False
         self.is_checkbox = is_checkbox # NEW: Store checkbox state
+        # NEW: The label never changes, so render it once into a texture instead of every frame
+        self.text_tex, self.text_w, self.text_h = surface_to_texture(font.render(text, True, WHITE))
         
     def update(self, mouse_pos):
         self.hovered = self.rect.collidepoint(mouse_pos)
+
+    # NEW: Free the label texture when the button is discarded
+    def delete_texture(self):
+        glDeleteTextures([self.text_tex])
     
     def draw_gl(self, x, y, is_selected=False):
         # Draw button background with fire-themed styling
@@ -307,19 +702,25 @@ class MenuButton:
 
         # NEW: Draw text for both button and checkbox types within the button's rect
         # This ensures the text is part of the button's clickable area. (Moved from draw_menu_ui/draw_pause_menu)
-        text_surface = self.font.render(self.text, True, WHITE)
         if self.is_checkbox: # Position text to the right of the checkbox square
             checkbox_size = self.rect.height * 0.7 # Needs to match the size calculated above
             text_x = x + checkbox_size + 10 # 10px padding from checkbox
-            text_y = y + (self.rect.height - text_surface.get_height()) / 2
+            text_y = y + (self.rect.height - self.text_h) // 2
         else: # Original button text positioning (centered)
-            text_x = x + (self.rect.width - text_surface.get_width()) // 2
-            text_y = y + (self.rect.height - text_surface.get_height()) // 2
-        
-        text_data = pygame.image.tostring(text_surface, "RGBA", True)
-        glRasterPos2d(text_x, text_y + text_surface.get_height()) # Pygame uses top-left for render, OpenGL bottom-left for rasterPos
-        glDrawPixels(text_surface.get_width(), text_surface.get_height(), 
-                    GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+            text_x = x + (self.rect.width - self.text_w) // 2
+            text_y = y + (self.rect.height - self.text_h) // 2
+
+        # NEW: Draw the cached label texture as a textured quad
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.text_tex)
+        glColor4f(1.0, 1.0, 1.0, 1.0)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 1); glVertex2f(text_x, text_y) # Texture data is stored bottom-up
+        glTexCoord2f(1, 1); glVertex2f(text_x + self.text_w, text_y)
+        glTexCoord2f(1, 0); glVertex2f(text_x + self.text_w, text_y + self.text_h)
+        glTexCoord2f(0, 0); glVertex2f(text_x, text_y + self.text_h)
+        glEnd()
+        glDisable(GL_TEXTURE_2D)
 
 class FireGame:
     def __init__(self, is_fullscreen_init=False): # NEW: Add is_fullscreen_init parameter
@@ -331,14 +732,16 @@ class FireGame:
         self.camera_rot_y = 45
         self.camera_rot_x = 30
         self.camera_zoom = -150
+        self.modelview = np.identity(4, dtype=np.float32) # NEW: Current camera matrix (column-major), set by the draw passes
         self.mouse_down = False
         self.last_mouse_pos = (0, 0)
         self.click_start_pos = (0, 0)
         self.CLICK_THRESHOLD = 5
 
-        self.grid = [[FOREST_DENSE for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.burnt_timers = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.ash_colors = [[None for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # NEW: Grid state is stored in contiguous NumPy arrays instead of lists of lists
+        self.grid = np.full((GRID_HEIGHT, GRID_WIDTH), FOREST_DENSE, dtype=np.uint8)
+        self.burnt_timers = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.float32) # Float: timers advance by dt * 60
+        self.ash_colors = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8) # Gray ash shade of burnt cells
 
         self.running = True
         self.game_over = False
@@ -353,7 +756,7 @@ class FireGame:
         self.controlled_burns_used = 0
         
         self.dt = 0.0 # NEW: Delta time for framerate independence
-        self.terrain_base_colors = {} # NEW: Store initial terrain colors to avoid per-frame noise
+        self.terrain_base_colors = np.zeros((GRID_HEIGHT, GRID_WIDTH, 3), dtype=np.uint8) # NEW: Store initial terrain colors to avoid per-frame noise
 
         self.difficulty = "Normal" # NEW: Default difficulty setting
         self.psx_effect_enabled = True # NEW: Flag for PSX effect - changed to True by default
@@ -375,22 +778,77 @@ class FireGame:
             self.font = pygame.font.Font(None, 28)
             self.small_font = pygame.font.Font(None, 20)
         
-        # NEW: Particle system list
-        self.particles = []
+        # NEW: Particle system stored as NumPy arrays, one row per particle.
+        # Rows [0, p_count) are live; dead particles are compacted away every update.
+        self.p_pos = np.zeros((MAX_PARTICLES, 3), dtype='f4')
+        self.p_vel = np.zeros((MAX_PARTICLES, 3), dtype='f4')
+        self.p_life = np.zeros(MAX_PARTICLES, dtype='f4')
+        self.p_max_life = np.ones(MAX_PARTICLES, dtype='f4')
+        self.p_size = np.zeros(MAX_PARTICLES, dtype='f4')
+        self.p_start_col = np.zeros((MAX_PARTICLES, 3), dtype='f4')
+        self.p_count = 0
 
         ### NEW ###
-        # Tree sprite management
-        self.trees = []
+        # Tree sprite management, one array row per tree: position, (width, height),
+        # grid cell (x, y), animation state, texture frame and animation timer
+        self.tree_pos = np.zeros((0, 3), dtype=np.float32)
+        self.tree_wh = np.zeros((0, 2), dtype=np.float32)
+        self.tree_cell = np.zeros((0, 2), dtype=np.intp)
+        self.tree_state = np.zeros(0, dtype=np.uint8)
+        self.tree_frame = np.zeros(0, dtype=np.uint8)
+        self.tree_anim_timer = np.zeros(0, dtype=np.float32)
         self.tree_textures = []
-        # NEW: Field grass sprite management
-        self.fieldgrass_sprites = []
+        # NEW: Field grass sprite management, stored the same way as trees
+        self.fieldgrass_pos = np.zeros((0, 3), dtype=np.float32)
+        self.fieldgrass_wh = np.zeros((0, 2), dtype=np.float32)
+        self.fieldgrass_cell = np.zeros((0, 2), dtype=np.intp)
         self.fieldgrass_texture = None # Single texture for field grass
-        # NEW: House sprite management
-        self.house_sprites = []
+        # NEW: House sprite management, stored the same way as trees
+        self.house_pos = np.zeros((0, 3), dtype=np.float32)
+        self.house_wh = np.zeros((0, 2), dtype=np.float32)
+        self.house_cell = np.zeros((0, 2), dtype=np.intp)
+        self.house_state = np.zeros(0, dtype=np.uint8)
         self.house_textures = {} # Dictionary to hold normal and burnt textures
-        self.particle_vbo_v = glGenBuffers(1) # VBO for particle vertex positions
-        self.particle_vbo_c = glGenBuffers(1) # VBO for particle colors
-        self.particle_buffer = np.array([], dtype='f4') # Pre-allocate numpy array
+        self.sprite_grid = np.full((GRID_HEIGHT, GRID_WIDTH), 255, dtype=np.uint8) # NEW: Cell states the sprites last saw; 255 = stale
+        self.index_sprite_cells() # NEW: Which sprites stand on each cell, so cell changes only touch those sprites
+        # NEW: Interleaved particle vertices (x, y, z, RGBA bytes), 4 per particle, sized for MAX_PARTICLES
+        self.particle_buffer = np.zeros((MAX_PARTICLES, 4), dtype=PARTICLE_VERTEX)
+        self.particle_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.particle_buffer.nbytes, None, GL_STREAM_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        # NEW: Unit quad corners, shared by the instanced billboard and particle shaders
+        corners = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype='f4')
+        self.quad_corner_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.quad_corner_vbo)
+        glBufferData(GL_ARRAY_BUFFER, corners.nbytes, corners, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        # NEW: Index buffer that draws consecutive 4-vertex quads as triangles, grown on demand
+        self.quad_ibo = glGenBuffers(1)
+        self.quad_index_capacity = 0
+        self.bind_quad_indices(max(MAX_PARTICLES, GRID_WIDTH * GRID_HEIGHT))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        self.billboard_vbo = glGenBuffers(1) # NEW: Interleaved VBO for all billboard sprite quads
+        self.billboard_buffer = np.zeros((0, 4, 9), dtype='f4') # NEW: Staging array for it, grown on demand
+        # NEW: Depth-sorted billboard arrays, reused until the camera or the sprite tables change
+        self.billboard_sort_camera = None
+        self.billboard_sort_sources = ()
+        # NEW: Ground plane VBOs. Cell corners never move, so positions are uploaded once; colors live
+        # in their own buffer so a changed cell only rewrites its 4 vertex colors.
+        cell_z, cell_x = np.mgrid[0:GRID_HEIGHT, 0:GRID_WIDTH]
+        ground_cells = np.zeros((GRID_HEIGHT * GRID_WIDTH, 3), dtype=np.float32)
+        ground_cells[:, 0] = cell_x.ravel() - GRID_WIDTH / 2
+        ground_cells[:, 2] = cell_z.ravel() - GRID_HEIGHT / 2
+        ground_verts = ground_cells[:, None, :] + np.array([(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)], dtype=np.float32)
+        self.ground_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.ground_vbo)
+        glBufferData(GL_ARRAY_BUFFER, ground_verts.nbytes, ground_verts, GL_STATIC_DRAW)
+        self.ground_colors = np.zeros((GRID_HEIGHT * GRID_WIDTH, 4, 3), dtype=np.uint8) # Mirror of the color VBO
+        self.ground_grid = np.full(GRID_HEIGHT * GRID_WIDTH, 255, dtype=np.uint8) # Cell states the colors were built from; 255 = stale
+        self.ground_color_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.ground_color_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.ground_colors.nbytes, self.ground_colors, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         # NEW: Game state management
         self.game_state = MENU_STATE
@@ -406,12 +864,7 @@ class FireGame:
             self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
         
         # Update viewport and projection for the current resolution
-        current_size = pygame.display.get_surface().get_size()
-        glViewport(0, 0, current_size[0], current_size[1])
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, (current_size[0] / current_size[1]), 0.1, 500.0)
-        glMatrixMode(GL_MODELVIEW)
+        self.update_projection()
 
         # NEW: Load title texture
         try:
@@ -422,6 +875,9 @@ class FireGame:
             self.title_texture = None, 0, 0 # Store default dimensions if load fails
 
         self.init_gl()
+        # NEW: Glyph atlases for HUD and pause menu text
+        self.font_atlas = GlyphAtlas(self.font)
+        self.small_font_atlas = GlyphAtlas(self.small_font)
         ### NEW ###
         # Load tree assets before generating terrain that uses them
         self.load_tree_textures()
@@ -429,9 +885,24 @@ class FireGame:
         self.load_fieldgrass_texture()
         # NEW: Load house textures
         self.load_house_textures()
+        # NEW: Sprite texture IDs as typed arrays, indexed by tree frame / house state when batching billboards
+        self.tree_texture_ids = np.array(self.tree_textures, dtype=np.uint32)
+        self.house_texture_ids = np.array([self.house_textures.get(HouseSprite.NORMAL, 0),
+                                           self.house_textures.get(HouseSprite.BURNT, 0)], dtype=np.uint32)
+        # NEW: Pack the sprite textures into one atlas for instanced drawing (falls back to the VBO path)
+        self.billboard_program = None
+        if self.running:
+            self.init_billboard_instancing()
+        # NEW: Expand particles into quads on the GPU when instancing is available (falls back to CPU-built quads)
+        self.particle_program = None
+        self.init_particle_instancing()
+        # NEW: Full-screen blits (PSX framebuffer, cached pause menu) use a bufferless shader when available
+        self.blit_program = None
+        self.init_blit_program()
         
         # NEW: Initialize menu buttons
         self.init_menu_buttons()
+        self.menu_overlay = OverlayCache() # NEW: Pre-rendered menu title and buttons, kept when the buttons are re-created
         
         # NEW: Initialize pause buttons
         self.init_pause_buttons()
@@ -440,6 +911,7 @@ class FireGame:
 
         # NEW: Sound initialization and loading
         pygame.mixer.init()
+        self.fire_sound_level = 0 # NEW: Mixer volume step (0..128) the fire sound was last set to
         try:
             self.fire_sound = pygame.mixer.Sound(resource_path('firesound.mp3'))
             self.fire_sound.play(-1) # Play indefinitely
@@ -456,11 +928,22 @@ class FireGame:
             print(f"Warning: Could not load ignite sound: {e}")
             self.ignite_sound = None
 
-    def init_gl(self):
-        glViewport(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+    # NEW: Set the viewport and rebuild the cached 3D / 2D projection matrices for the current display size.
+    # Only called when the display mode changes; per-frame passes just glLoadMatrixf the cached matrices.
+    def update_projection(self):
+        current_size = pygame.display.get_surface().get_size()
+        self.window_size = current_size # NEW: Cached for the per-frame passes instead of asking SDL every frame
+        self.proj_matrix = perspective_matrix(45, current_size[0] / current_size[1], 0.1, 500.0)
+        self.ui_matrix = ortho_matrix(0, current_size[0], current_size[1], 0)
+        glViewport(0, 0, current_size[0], current_size[1])
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, (WINDOW_WIDTH / WINDOW_HEIGHT), 0.1, 500.0)
+        glLoadMatrixf(self.proj_matrix)
+        glMatrixMode(GL_MODELVIEW)
+        self.click_unproject_camera = None # NEW: The cached click unprojection used the old projection
+        self.billboard_sort_camera = None # NEW: So did the billboard frustum cull
+
+    def init_gl(self):
+        # NEW: Viewport and projection are already set up by update_projection for the actual display size
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         glEnable(GL_DEPTH_TEST)
@@ -472,8 +955,21 @@ class FireGame:
         glLightfv(GL_LIGHT0, GL_AMBIENT, (0.3, 0.3, 0.3, 1))
         glLightfv(GL_LIGHT0, GL_DIFFUSE, (0.7, 0.7, 0.7, 1))
         glEnable(GL_COLOR_MATERIAL)
+        # NEW: The PSX FBO is created on first use by begin_psx_pass, so it costs nothing while the effect is off
+
+    # NEW: Compile the bufferless full-screen blit shader; GLSL 1.30 is needed for gl_VertexID
+    def init_blit_program(self):
+        try:
+            program = link_program(BLIT_VERTEX_SHADER, BLIT_FRAGMENT_SHADER)
+            glUseProgram(program)
+            glUniform1i(glGetUniformLocation(program, "screen"), 0)
+            glUseProgram(0)
+            self.blit_program = program
+        except Exception as e:
+            print(f"Warning: Bufferless blit unavailable, using textured quads. {e}")
 
-        # NEW: FBO setup for PSX effect
+    # NEW: FBO setup for PSX effect
+    def init_psx_fbo(self):
         # Create FBO
         self.fbo = glGenFramebuffers(1)
         glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
@@ -499,6 +995,82 @@ class FireGame:
         
         glBindFramebuffer(GL_FRAMEBUFFER, 0) # Unbind FBO, render to default framebuffer
 
+        if self.blit_program:
+            return # NEW: The bufferless blit shader needs no geometry
+
+        # NEW: The blit quad never changes, so its vertices (u, v, x, y) live in a static VBO.
+        # Top-left of the quad maps to bottom-left of the texture.
+        blit_quad = np.array([(0, 1, 0, 0), (1, 1, WINDOW_WIDTH, 0),
+                              (1, 0, WINDOW_WIDTH, WINDOW_HEIGHT), (0, 0, 0, WINDOW_HEIGHT)], dtype=np.float32)
+        self.psx_quad_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.psx_quad_vbo)
+        glBufferData(GL_ARRAY_BUFFER, blit_quad.nbytes, blit_quad, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    # NEW: Start a scene; with the PSX effect on it is rendered into the low-res FBO, otherwise straight to the screen
+    def begin_psx_pass(self):
+        if self.psx_effect_enabled:
+            if not self.fbo:
+                self.init_psx_fbo()
+            glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+            glViewport(0, 0, self.fbo_width, self.fbo_height)
+
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+    # NEW: Render FBO texture to screen if PSX effect is enabled (nothing to do when drawing directly)
+    def end_psx_pass(self):
+        if not self.psx_effect_enabled:
+            return
+
+        glBindFramebuffer(GL_FRAMEBUFFER, 0) # Bind back to default framebuffer
+        glViewport(0, 0, self.window_size[0], self.window_size[1]) # Restore original viewport
+
+        # No need to clear here as the next draw will cover the entire screen.
+        if self.blit_program:
+            glDisable(GL_DEPTH_TEST)
+            self.blit_texture(self.fbo_texture)
+            glEnable(GL_DEPTH_TEST)
+            return
+
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadMatrixf(PSX_BLIT_MATRIX) # Set up 2D orthographic projection
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+
+        glDisable(GL_LIGHTING) # No lighting for 2D quad
+        glDisable(GL_DEPTH_TEST) # No depth testing for 2D quad
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.fbo_texture)
+        glColor4f(1.0, 1.0, 1.0, 1.0) # Ensure full white color to see texture as is
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.psx_quad_vbo)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glTexCoordPointer(2, GL_FLOAT, 16, ctypes.c_void_p(0))
+        glVertexPointer(2, GL_FLOAT, 16, ctypes.c_void_p(8))
+        glDrawArrays(GL_TRIANGLE_FAN, 0, 4)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glDisable(GL_TEXTURE_2D)
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_LIGHTING)
+
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopMatrix()
+
+    # NEW: Cover the viewport with a texture using the bufferless blit shader
+    def blit_texture(self, texture):
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glUseProgram(self.blit_program)
+        glDrawArrays(GL_TRIANGLES, 0, 3)
+        glUseProgram(0)
+
     ### NEW ###
     # Helper function to load a single image file into an OpenGL texture
     def load_texture(self, path):
@@ -508,21 +1080,7 @@ class FireGame:
         except pygame.error as e:
             print(f"ERROR: Unable to load texture at '{path}'. {e}")
             raise
-        textureData = pygame.image.tostring(textureSurface, "RGBA", True)
-        width = textureSurface.get_width()
-        height = textureSurface.get_height()
-
-        texid = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texid)
-        
-        # --- FIX FOR BLURRY TEXTURES ---
-        # Use GL_NEAREST to get a sharp, pixelated look instead of a blurry one.
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-        
-        # Upload the texture data.
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, textureData)
-        return texid, width, height # NEW: Return width and height as well
+        return surface_to_texture(textureSurface) # NEW: Return width and height as well
 
     ### NEW ###
     # Load all the tree animation frames into a list of textures
@@ -573,6 +1131,91 @@ class FireGame:
             print(f"Error: {e}")
             self.running = False # Critical assets are missing
 
+    # NEW: Set up instanced billboard rendering: a texture atlas of every sprite texture, the shader,
+    # a static unit quad and a per-instance buffer. Needs GL 3.3-level instancing; if anything is
+    # missing, billboards keep using the per-texture VBO path.
+    def init_billboard_instancing(self):
+        try:
+            if not (bool(glDrawArraysInstanced) and bool(glVertexAttribDivisor)):
+                raise RuntimeError("instanced rendering is not supported")
+
+            # Read the loaded textures back and place them side by side, 1px apart so
+            # GL_NEAREST sampling at a sprite's edge never picks up its neighbor
+            texture_ids = sorted(set(self.tree_textures) | {self.fieldgrass_texture} | set(self.house_textures.values()))
+            images = []
+            for texture_id in texture_ids:
+                glBindTexture(GL_TEXTURE_2D, texture_id)
+                width = glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_WIDTH)
+                height = glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_HEIGHT)
+                data = glGetTexImage(GL_TEXTURE_2D, 0, GL_RGBA, GL_UNSIGNED_BYTE)
+                images.append(np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4))
+            atlas_width = sum(image.shape[1] + 1 for image in images)
+            atlas_height = max(image.shape[0] for image in images)
+            if max(atlas_width, atlas_height) > glGetIntegerv(GL_MAX_TEXTURE_SIZE):
+                raise RuntimeError("sprite atlas is larger than GL_MAX_TEXTURE_SIZE")
+
+            # Rows are bottom-up like the source textures; each sprite's (u0, u1, v1), indexed by texture ID
+            atlas = np.zeros((atlas_height, atlas_width, 4), dtype=np.uint8)
+            self.sprite_atlas_uv = np.zeros((max(texture_ids) + 1, 3), dtype=np.float32)
+            x = 0
+            for texture_id, image in zip(texture_ids, images):
+                height, width = image.shape[:2]
+                atlas[:height, x:x + width] = image
+                self.sprite_atlas_uv[texture_id] = (x / atlas_width, (x + width) / atlas_width, height / atlas_height)
+                x += width + 1
+
+            self.sprite_atlas = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, self.sprite_atlas)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, atlas_width, atlas_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, atlas)
+
+            program = link_program(BILLBOARD_VERTEX_SHADER, BILLBOARD_FRAGMENT_SHADER)
+            self.billboard_attribs = [glGetAttribLocation(program, name) for name in ("sprite_pos", "sprite_size", "sprite_uv")]
+            self.billboard_camera_right = glGetUniformLocation(program, "camera_right")
+            glUseProgram(program)
+            glUniform1i(glGetUniformLocation(program, "atlas"), 0)
+            glUseProgram(0)
+
+            # Per-instance x, y, z, width, height, tint, u0, u1, v1 (36 bytes), grown on demand
+            self.billboard_instance_vbo = glGenBuffers(1)
+            self.billboard_instances = np.zeros((0, 9), dtype='f4')
+            self.billboard_program = program
+            print("Instanced billboard rendering enabled.")
+        except Exception as e:
+            print(f"Warning: Instanced billboards unavailable, using the VBO path. {e}")
+            glBindTexture(GL_TEXTURE_2D, 0)
+
+    # NEW: Bind the quad index buffer, making sure it covers quad_count quads. Quad q's triangles are
+    # indices [6q, 6q + 6), so a run of quads starting at quad q is drawn from byte offset 24q.
+    def bind_quad_indices(self, quad_count):
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.quad_ibo)
+        if quad_count > self.quad_index_capacity:
+            self.quad_index_capacity = max(quad_count, 2 * self.quad_index_capacity)
+            indices = np.arange(self.quad_index_capacity, dtype=np.uint32)[:, None] * 4 + QUAD_TRIANGLES
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+
+    # NEW: Set up instanced particles: one 20-byte instance (x, y, z, size, RGBA bytes) per particle
+    # instead of four 16-byte vertices
+    def init_particle_instancing(self):
+        try:
+            if not (bool(glDrawArraysInstanced) and bool(glVertexAttribDivisor)):
+                raise RuntimeError("instanced rendering is not supported")
+            program = link_program(PARTICLE_VERTEX_SHADER, PARTICLE_FRAGMENT_SHADER)
+            self.particle_attribs = [glGetAttribLocation(program, name) for name in ("particle_pos", "particle_color")]
+            self.particle_camera_right = glGetUniformLocation(program, "camera_right")
+            self.particle_camera_up = glGetUniformLocation(program, "camera_up")
+
+            self.particle_instances = np.zeros(MAX_PARTICLES, dtype=PARTICLE_INSTANCE)
+            self.particle_instance_vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, self.particle_instance_vbo)
+            glBufferData(GL_ARRAY_BUFFER, self.particle_instances.nbytes, None, GL_STREAM_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            self.particle_program = program
+            print("Instanced particle rendering enabled.")
+        except Exception as e:
+            print(f"Warning: Instanced particles unavailable, using the VBO path. {e}")
+
     ### NEW ###
     # Initialize menu buttons
     def init_menu_buttons(self):
@@ -599,8 +1242,7 @@ class FireGame:
         # NEW: PSX Effect checkbox (Main Menu)
         # Positioned in top-right corner, now with a wider clickable area to include text.
         checkbox_box_size = 40 # Size of the visible checkbox square
-        psx_text_surface_temp = self.small_font.render("PSX Effect", True, WHITE) # Render once to get width
-        psx_text_width = psx_text_surface_temp.get_width() # Get width of the text
+        psx_text_width = self.small_font.size("PSX Effect")[0] # NEW: Measure the text without rendering it
         
         # Total width for the button's rect to cover both checkbox and text, plus padding
         # This rect will be used for hover/click detection.
@@ -614,6 +1256,17 @@ class FireGame:
                                                 self.small_font, 
                                                 is_checkbox=True)
 
+        # NEW: All main menu buttons, in draw order
+        self.menu_buttons = [
+            self.start_button,
+            self.fullscreen_button,
+            self.quit_button,
+            self.easy_button,
+            self.normal_button,
+            self.hard_button,
+            self.psx_effect_button_menu
+        ]
+
     # NEW: Toggle fullscreen function
     def toggle_fullscreen(self):
         self.is_fullscreen = not self.is_fullscreen
@@ -624,12 +1277,7 @@ class FireGame:
             self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
         
         # Update viewport and projection for the new resolution
-        current_size = pygame.display.get_surface().get_size()
-        glViewport(0, 0, current_size[0], current_size[1])
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, (current_size[0] / current_size[1]), 0.1, 500.0)
-        glMatrixMode(GL_MODELVIEW)
+        self.update_projection()
 
     # NEW: Start game from menu with fade transition
     def start_game_from_menu(self):
@@ -640,39 +1288,41 @@ class FireGame:
             self.fire_sound.play(-1)
 
     ### NEW ###
-    # Populate the `self.trees` list based on the generated map
+    # Populate the tree arrays based on the generated map
     def place_trees(self):
-        self.trees = []
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] == FOREST_LIGHT:
-                    # Not every light forest cell gets a tree, for a more natural look
-                    if random.random() < 0.75:
-                        self.trees.append(Tree(x, y))
-        print(f"Placed {len(self.trees)} trees.")
+        # NEW: Candidate cells as (x, y) rows, with the random numbers drawn in batches instead of per cell
+        candidates = np.argwhere(self.grid == FOREST_LIGHT)[:, ::-1]
+        # Not every light forest cell gets a tree, for a more natural look
+        self.tree_cell = np.ascontiguousarray(candidates[np.random.random(len(candidates)) < 0.75], dtype=np.intp)
+        num_trees = len(self.tree_cell)
+        # Add a random offset so trees aren't perfectly centered in grid cells
+        offsets = np.random.uniform(-0.3, 0.3, size=(num_trees, 2))
+        self.tree_pos = sprite_positions(self.tree_cell, offsets)
+        self.tree_wh = sprite_dimensions(num_trees, Tree.WIDTH, Tree.HEIGHT)
+        self.tree_state = np.full(num_trees, Tree.NORMAL, dtype=np.uint8)
+        self.tree_frame = np.zeros(num_trees, dtype=np.uint8)
+        self.tree_anim_timer = np.zeros(num_trees, dtype=np.float32)
+        print(f"Placed {num_trees} trees.")
 
     ### NEW ###
-    # Populate the `self.fieldgrass_sprites` list
+    # Populate the field grass arrays
     def place_fieldgrass(self):
-        self.fieldgrass_sprites = []
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                # Only spawn on every 2nd FIELD tile for performance
-                if self.grid[y][x] == FIELD and (x + y) % 2 == 0: 
-                    # Place multiple grass sprites per cell for density
-                    for _ in range(random.randint(1, 2)): 
-                        self.fieldgrass_sprites.append(FieldGrass(x, y))
-        print(f"Placed {len(self.fieldgrass_sprites)} field grass sprites.")
+        # Only spawn on every 2nd FIELD tile for performance
+        ys, xs = np.indices(self.grid.shape)
+        candidates = np.argwhere((self.grid == FIELD) & ((xs + ys) % 2 == 0))[:, ::-1]
+        # Place multiple grass sprites per cell for density (NEW: 1 or 2 per cell, drawn in one batch)
+        self.fieldgrass_cell = np.repeat(candidates, np.random.randint(1, 3, size=len(candidates)), axis=0).astype(np.intp)
+        num_grass = len(self.fieldgrass_cell)
+        offsets = np.random.uniform(-0.4, 0.4, size=(num_grass, 2))
+        self.fieldgrass_pos = sprite_positions(self.fieldgrass_cell, offsets)
+        self.fieldgrass_wh = sprite_dimensions(num_grass, FieldGrass.WIDTH, FieldGrass.HEIGHT)
+        print(f"Placed {num_grass} field grass sprites.")
 
     ### NEW ###
     # Draws all billboarded sprites (trees, field grass, houses) in correct depth order
     def draw_billboard_sprites(self):
-        all_billboards = []
-        all_billboards.extend(self.trees)
-        all_billboards.extend(self.fieldgrass_sprites)
-        all_billboards.extend(self.house_sprites)
-
-        if not all_billboards:
+        num_sprites = len(self.tree_pos) + len(self.fieldgrass_pos) + len(self.house_pos)
+        if num_sprites == 0:
             return
 
         glDisable(GL_LIGHTING)
@@ -689,43 +1339,55 @@ class FireGame:
         glDepthMask(GL_FALSE)
         
         # Get camera vectors for billboard calculation
-        modelview = np.array(glGetDoublev(GL_MODELVIEW_MATRIX)).reshape((4,4))
+        modelview = self.modelview
         camera_forward = -np.array([modelview[0, 2], modelview[1, 2], modelview[2, 2]])
 
-        # Sort all sprites by their depth along the camera's forward direction
-        all_billboards.sort(key=lambda s: np.dot(s.pos, camera_forward), reverse=True)
-
-        glColor4f(1.0, 1.0, 1.0, 1.0) # Ensure no tinting by default
-
-        for sprite in all_billboards:
-            texture_id = sprite.get_texture_id(self)
-            width, height = sprite.get_dimensions()
-
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            
-            glPushMatrix()
-            glTranslatef(sprite.pos[0], sprite.pos[1], sprite.pos[2])
-            
-            # Billboard the sprite to always face the camera
-            glRotatef(-self.camera_rot_y, 0, 1, 0)
-            
-            w = width / 2
-            h = height
-            
-            # Apply specific tint for field grass
-            if isinstance(sprite, FieldGrass):
-                glColor4f(0.7, 0.7, 0.7, 1.0) # Darker tint for field grass
-            else:
-                glColor4f(1.0, 1.0, 1.0, 1.0) # No tint for other sprites
-
-            glBegin(GL_QUADS)
-            glTexCoord2f(0, 0); glVertex3f(-w, 0, 0)
-            glTexCoord2f(1, 0); glVertex3f(w, 0, 0)
-            glTexCoord2f(1, 1); glVertex3f(w, h, 0)
-            glTexCoord2f(0, 1); glVertex3f(-w, h, 0)
-            glEnd()
-            
-            glPopMatrix()
+        # NEW: Sprite positions, sizes and tints only change when a sprite table is replaced (new map,
+        # grass burning away), and the visible set and sort order only when the camera moves. Rebuild the
+        # sorted arrays only then; the sprite tables are never modified in place, so identity is a safe check.
+        sources = (self.tree_pos, self.fieldgrass_pos, self.house_pos)
+        if (self.billboard_sort_camera is None or not np.array_equal(modelview, self.billboard_sort_camera)
+                or any(source is not cached for source, cached in zip(sources, self.billboard_sort_sources))):
+            # Gather every sprite type into combined arrays (trees, then field grass, then houses)
+            positions = np.concatenate(sources)
+            dimensions = np.concatenate((self.tree_wh, self.fieldgrass_wh, self.house_wh))
+            # Darker tint for field grass, no tint for other sprites
+            tints = np.ones(num_sprites, dtype='f4')
+            tints[len(self.tree_pos):len(self.tree_pos) + len(self.fieldgrass_pos)] = 0.7
+
+            # NEW: Cull sprites whose bounding sphere (around the base, reaching the top corners) is wholly
+            # outside the view frustum, so they are neither sorted nor drawn
+            planes = frustum_planes(modelview @ self.proj_matrix)
+            radii = np.hypot(dimensions[:, 0] / 2, dimensions[:, 1])
+            visible = np.flatnonzero((positions @ planes[:, :3].T + planes[:, 3] > -radii[:, None]).all(axis=1))
+
+            # Sort the visible sprites by their depth along the camera's forward direction, farthest first.
+            # A stable argsort keeps sprites at equal depth in their original order.
+            depths = positions[visible] @ camera_forward
+            self.billboard_order = visible[np.argsort(-depths, kind='stable')]
+            self.billboard_sorted = (positions[self.billboard_order], dimensions[self.billboard_order], tints[self.billboard_order])
+            self.billboard_sort_camera = modelview
+            self.billboard_sort_sources = sources
+        positions, dimensions, tints = self.billboard_sorted
+
+        # Texture IDs follow the animation state, so they are gathered every frame
+        texture_ids = np.concatenate((self.tree_texture_ids[self.tree_frame],
+                                      np.full(len(self.fieldgrass_pos), self.fieldgrass_texture, dtype=np.uint32),
+                                      self.house_texture_ids[self.house_state]))[self.billboard_order]
+
+        # NEW: Build every camera-facing quad on the CPU in one pass and draw them from a single VBO.
+        # The sprites rotate around the Y axis only, matching glRotatef(-camera_rot_y, 0, 1, 0).
+        angle = math.radians(self.camera_rot_y)
+        right = np.array([math.cos(angle), 0.0, math.sin(angle)], dtype='f4')
+        up = np.array([0.0, 1.0, 0.0], dtype='f4')
+
+        # NEW: With instancing available, every sprite goes out in a single draw call
+        if not len(positions):
+            pass # Every sprite was culled
+        elif self.billboard_program:
+            self.draw_billboards_instanced(positions, dimensions, texture_ids, tints, right)
+        else:
+            self.draw_billboard_runs(positions, dimensions, texture_ids, tints, right, up)
 
         # --- FIX: RESTORE OPENGL STATE ---
         # Re-enable writing to the depth buffer for the next rendering pass.
@@ -736,6 +1398,86 @@ class FireGame:
         glDisable(GL_TEXTURE_2D)
         glEnable(GL_LIGHTING)
 
+    # NEW: Draw depth-sorted billboards with one instance per sprite from the texture atlas
+    def draw_billboards_instanced(self, positions, dimensions, texture_ids, tints, right):
+        num_sprites = len(positions)
+        glBindBuffer(GL_ARRAY_BUFFER, self.billboard_instance_vbo)
+        if num_sprites > len(self.billboard_instances):
+            self.billboard_instances = np.empty((num_sprites, 9), dtype='f4')
+            glBufferData(GL_ARRAY_BUFFER, self.billboard_instances.nbytes, None, GL_STREAM_DRAW)
+        instances = self.billboard_instances[:num_sprites]
+        instances[:, 0:3] = positions
+        instances[:, 3:5] = dimensions
+        instances[:, 5] = tints
+        instances[:, 6:9] = self.sprite_atlas_uv[texture_ids]
+        glBufferSubData(GL_ARRAY_BUFFER, 0, instances.nbytes, instances)
+
+        glUseProgram(self.billboard_program)
+        glUniform3f(self.billboard_camera_right, *right)
+        glBindTexture(GL_TEXTURE_2D, self.sprite_atlas)
+        for location, offset, size in zip(self.billboard_attribs, (0, 12, 24), (3, 3, 3)):
+            glEnableVertexAttribArray(location)
+            glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, 36, ctypes.c_void_p(offset))
+            glVertexAttribDivisor(location, 1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.quad_corner_vbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+
+        glDrawArraysInstanced(GL_TRIANGLE_FAN, 0, 4, num_sprites)
+
+        glDisableVertexAttribArray(0)
+        for location in self.billboard_attribs:
+            glVertexAttribDivisor(location, 0)
+            glDisableVertexAttribArray(location)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    # NEW: Draw depth-sorted billboards as CPU-built quads, one draw call per run of sprites sharing a texture
+    def draw_billboard_runs(self, positions, dimensions, texture_ids, tints, right, up):
+        num_sprites = len(positions)
+        # NEW: Reuse the staging array and the VBO storage between frames, growing both only when
+        # a new map has more sprites than they can hold. Texture coordinates and alpha never change,
+        # so they are written once when the staging array is allocated.
+        glBindBuffer(GL_ARRAY_BUFFER, self.billboard_vbo)
+        if num_sprites > len(self.billboard_buffer):
+            self.billboard_buffer = np.empty((num_sprites, 4, 9), dtype='f4')
+            self.billboard_buffer[:, :, 3:5] = ((0, 0), (1, 0), (1, 1), (0, 1))
+            self.billboard_buffer[:, :, 8] = 1.0
+            glBufferData(GL_ARRAY_BUFFER, self.billboard_buffer.nbytes, None, GL_STREAM_DRAW)
+
+        half_widths = dimensions[:, 0:1] / 2
+        heights = dimensions[:, 1:2]
+        # Each vertex is interleaved as x, y, z, u, v, r, g, b, a (36 bytes)
+        vertex_data = self.billboard_buffer[:num_sprites]
+        vertex_data[:, 0, 0:3] = positions - half_widths * right
+        vertex_data[:, 1, 0:3] = positions + half_widths * right
+        vertex_data[:, 2, 0:3] = positions + half_widths * right + heights * up
+        vertex_data[:, 3, 0:3] = positions - half_widths * right + heights * up
+        vertex_data[:, :, 5:8] = tints[:, None, None]
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertex_data.nbytes, vertex_data)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 36, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, 36, ctypes.c_void_p(12))
+        glColorPointer(4, GL_FLOAT, 36, ctypes.c_void_p(20))
+
+        # Sprites must stay in back-to-front order because depth writes are off, so instead of
+        # grouping all sprites by texture, draw each run of consecutive sprites sharing a texture.
+        run_starts = np.flatnonzero(np.r_[True, texture_ids[1:] != texture_ids[:-1]])
+        run_ends = np.r_[run_starts[1:], num_sprites]
+        self.bind_quad_indices(num_sprites)
+        for start, end in zip(run_starts, run_ends):
+            glBindTexture(GL_TEXTURE_2D, int(texture_ids[start]))
+            glDrawElements(GL_TRIANGLES, int(end - start) * 6, GL_UNSIGNED_INT, ctypes.c_void_p(int(start) * 24))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
     def init_pause_buttons(self):
         button_width, button_height = 250, 50
         # The x, y positions will be dynamically updated in the draw call
@@ -756,30 +1498,29 @@ class FireGame:
         # NEW: Volume Slider Properties
         self.volume_slider_rect = pygame.Rect(WINDOW_WIDTH // 2 - 150, fullscreen_button_y + button_height + 40, 300, 20) # Centered below fullscreen
         self.volume_slider_thumb_radius = 10
+        # NEW: The thumb circle never changes shape, so it is uploaded once and only translated when drawn
+        thumb_fan = THUMB_FAN * self.volume_slider_thumb_radius
+        self.thumb_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.thumb_vbo)
+        glBufferData(GL_ARRAY_BUFFER, thumb_fan.nbytes, thumb_fan, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
         self.is_dragging_volume_slider = False
+        self.pause_overlay = OverlayCache() # NEW: Pre-rendered pause menu
 
     def generate_terrain(self):
-        seed = random.randint(0, 1000)
-        jitter = [[(random.random()*0.05, random.random()*0.05)
-                   for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                nx, ny = x/GRID_WIDTH, y/GRID_HEIGHT
-                jx, jy = jitter[y][x]
-                nx += jx; ny += jy
-                low = noise.pnoise2(nx*3.0, ny*3.0, octaves=4, persistence=0.5, lacunarity=2.0, base=seed)
-                high = noise.pnoise2(nx*10.0, ny*10.0, octaves=1, persistence=0.4, lacunarity=2.5, base=seed+1)
-                combined = low * 0.85 + high * 0.15
-                elevation = noise.pnoise2(nx*1.0+50, ny*1.0+50, octaves=2, persistence=0.5, lacunarity=2.0, base=seed+2)
-                value = combined + 0.3*elevation
-                value = math.tanh(value * 1.2)
-
-                if value < -0.4: self.grid[y][x] = WATER
-                elif value < -0.15: self.grid[y][x] = FIELD
-                elif value < 0.05: self.grid[y][x] = GRASSLAND
-                elif value < 0.25: self.grid[y][x] = FOREST_LIGHT
-                else: self.grid[y][x] = FOREST_DENSE
+        # NEW: Evaluate the noise for the whole grid at once instead of calling pnoise2 per cell
+        ny, nx = np.mgrid[0:GRID_HEIGHT, 0:GRID_WIDTH].astype(np.float32)
+        nx = nx / GRID_WIDTH + np.random.random(nx.shape).astype(np.float32) * 0.05
+        ny = ny / GRID_HEIGHT + np.random.random(ny.shape).astype(np.float32) * 0.05
+
+        low = fractal_noise2(nx*3.0, ny*3.0, noise_permutation(), octaves=4, persistence=0.5, lacunarity=2.0)
+        high = fractal_noise2(nx*10.0, ny*10.0, noise_permutation(), octaves=1, persistence=0.4, lacunarity=2.5)
+        combined = low * 0.85 + high * 0.15
+        elevation = fractal_noise2(nx*1.0+50, ny*1.0+50, noise_permutation(), octaves=2, persistence=0.5, lacunarity=2.0)
+        value = np.tanh((combined + 0.3*elevation) * 1.2)
+
+        self.grid[:] = np.select([value < -0.4, value < -0.15, value < 0.05, value < 0.25],
+                                 [WATER, FIELD, GRASSLAND, FOREST_LIGHT], default=FOREST_DENSE)
 
         # NEW: Reordered to generate water features BEFORE houses.
         self.add_rivers()
@@ -793,18 +1534,26 @@ class FireGame:
         # NEW: Place field grass objects after terrain generation
         self.place_fieldgrass()
 
-        # NEW: Initialize and store base colors for terrain types (excluding FIRE, BURNT, WATER)
-        base_colors_dict = { FOREST_DENSE: DARK_GREEN, FOREST_LIGHT: LIGHT_GREEN, GRASSLAND: GRASS_GREEN, FIELD: FIELD_YELLOW, HOUSE: HOUSE_RED }
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                terrain_type = self.grid[y][x]
-                if terrain_type in [FOREST_DENSE, FOREST_LIGHT, GRASSLAND, FIELD, HOUSE]:
-                    base_color = base_colors_dict.get(terrain_type, BLACK)
-                    # Apply variation once at generation
-                    variation = random.randint(-5, 5)
-                    self.terrain_base_colors[(x,y)] = tuple(max(0, min(255, c + variation)) for c in base_color)
-
-    # [UNCHANGED METHODS: add_rivers, add_houses, add_clearings, add_lakes, setup_game, get_neighbors, etc.]
+        # NEW: Initialize and store base colors for terrain types (excluding FIRE, BURNT, WATER), for the whole grid at once
+        base_colors_lut = np.zeros((9, 3), dtype=np.int16) # Indexed by cell state; black for states without a base color
+        for terrain_type, base_color in ((FOREST_DENSE, DARK_GREEN), (FOREST_LIGHT, LIGHT_GREEN), (GRASSLAND, GRASS_GREEN),
+                                         (FIELD, FIELD_YELLOW), (HOUSE, HOUSE_RED)):
+            base_colors_lut[terrain_type] = base_color
+        has_base_color = IS_BURNABLE[self.grid]
+        # Apply variation once at generation
+        variation = np.random.randint(-5, 6, size=self.grid.shape) * has_base_color
+        self.terrain_base_colors[:] = np.clip(base_colors_lut[self.grid] + variation[..., None], 0, 255)
+        self.ground_grid.fill(255) # NEW: New base colors, so every ground cell must be rebuilt
+        self.sprite_grid.fill(255) # NEW: New sprite tables, so they must all be checked against the grid
+        self.index_sprite_cells()
+
+    # NEW: Rebuild the cell -> sprite lookups after sprite tables are replaced
+    def index_sprite_cells(self):
+        self.tree_lookup = cell_sprite_lookup(self.tree_cell)
+        self.fieldgrass_lookup = cell_sprite_lookup(self.fieldgrass_cell)
+        self.house_lookup = cell_sprite_lookup(self.house_cell)
+
+    # [UNCHANGED METHODS: add_rivers, add_houses, add_clearings, add_lakes, setup_game, etc.]
     # ... All the methods from the previous version are here ...
     def add_rivers(self):
         num_rivers = random.randint(1, 3)
@@ -814,71 +1563,73 @@ class FireGame:
             else:
                 start_x, start_y, direction = random.randint(GRID_WIDTH // 4, 3 * GRID_WIDTH // 4), 0, 1
             x, y, river_length = start_x, start_y, random.randint(30, 80)
+            # NEW: Walk the river course first, then widen it with every splash roll drawn in one call
+            course = []
             for i in range(river_length):
-                if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-                    self.grid[y][x] = WATER
-                    for dx_r in range(-1, 2):
-                        for dy_r in range(-1, 2):
-                            if (dx_r == 0 and dy_r == 0): continue
-                            prob = 0.6 / (abs(dx_r) + abs(dy_r) + 0.5)
-                            if random.random() < prob:
-                                nx_r, ny_r = x + dx_r, y + dy_r
-                                if 0 <= nx_r < GRID_WIDTH and 0 <= ny_r < GRID_HEIGHT:
-                                    self.grid[ny_r][nx_r] = WATER
+                course.append((x, y))
                 if random.random() < 0.3: direction = random.choice([-1, 0, 1])
                 if start_x == 0: x += 1; y += direction
                 else: y += 1; x += direction
                 x, y = max(0, min(GRID_WIDTH - 1, x)), max(0, min(GRID_HEIGHT - 1, y))
+            course = np.array(course)
+            self.grid[course[:, 1], course[:, 0]] = WATER
+            splash = course[:, None, :] + np.array(NEIGHBOR_OFFSETS)
+            splash = splash[np.random.random((river_length, len(NEIGHBOR_OFFSETS))) < RIVER_SPLASH_CHANCE]
+            in_grid = (splash[:, 0] >= 0) & (splash[:, 0] < GRID_WIDTH) & (splash[:, 1] >= 0) & (splash[:, 1] < GRID_HEIGHT)
+            self.grid[splash[in_grid, 1], splash[in_grid, 0]] = WATER
 
     def add_houses(self):
         self.houses_total = 0
-        # NEW: Clear existing house sprites before adding new ones (for restarts)
-        self.house_sprites = []
+        house_cells = [] # NEW: Collect house sprite cells, replacing existing ones (for restarts)
         for _ in range(random.randint(3, 7)):
             for _ in range(50):
                 cx, cy = random.randint(5, GRID_WIDTH - 5), random.randint(5, GRID_HEIGHT - 5)
                 # FIX: Check ensures we don't try to build a house cluster in water
-                if self.grid[cy][cx] in [GRASSLAND, FIELD]:
+                if self.grid[cy, cx] in [GRASSLAND, FIELD]:
                     for _ in range(random.randint(2, 6)):
                         hx, hy = cx + random.randint(-3, 3), cy + random.randint(-3, 3)
                         # FIX: Check ensures individual houses aren't placed in water either
                         if (0 <= hx < GRID_WIDTH and 0 <= hy < GRID_HEIGHT and
-                                self.grid[hy][hx] not in [WATER, HOUSE]):
-                            self.grid[hy][hx] = HOUSE
-                            # NEW: Create a HouseSprite instance for each house
-                            self.house_sprites.append(HouseSprite(hx, hy))
+                                self.grid[hy, hx] not in [WATER, HOUSE]):
+                            self.grid[hy, hx] = HOUSE
+                            # NEW: Create a house sprite for each house
+                            house_cells.append((hx, hy))
                             self.houses_total += 1
                     break
+        self.house_cell = np.array(house_cells, dtype=np.intp).reshape(len(house_cells), 2)
+        self.house_pos = sprite_positions(self.house_cell)
+        self.house_wh = sprite_dimensions(len(house_cells), HouseSprite.WIDTH, HouseSprite.HEIGHT)
+        self.house_state = np.full(len(house_cells), HouseSprite.NORMAL, dtype=np.uint8)
 
     def add_clearings(self):
         for _ in range(random.randint(5, 10)):
             cx, cy = random.randint(3, GRID_WIDTH - 3), random.randint(3, GRID_HEIGHT - 3)
-            if self.grid[cy][cx] == FOREST_DENSE:
+            if self.grid[cy, cx] == FOREST_DENSE:
                 clearing_size = random.randint(2, 5)
                 for dx in range(-clearing_size//2, clearing_size//2 + 1):
                     for dy in range(-clearing_size//2, clearing_size//2 + 1):
                         if (0 <= cx + dx < GRID_WIDTH and 0 <= cy + dy < GRID_HEIGHT and random.random() < 0.6):
-                            self.grid[cy + dy][cx + dx] = GRASSLAND
+                            self.grid[cy + dy, cx + dx] = GRASSLAND
 
     def add_lakes(self):
         num_lakes = random.randint(1, 3)
         for _ in range(num_lakes):
             for _ in range(50):
                 center_x, center_y = random.randint(5, GRID_WIDTH - 5), random.randint(5, GRID_HEIGHT - 5)
-                if self.grid[center_y][center_x] != WATER:
+                if self.grid[center_y, center_x] != WATER:
                     lake_radius = random.randint(4, 8)
-                    for y_offset in range(-lake_radius, lake_radius + 1):
-                        for x_offset in range(-lake_radius, lake_radius + 1):
-                            dist = math.sqrt(x_offset**2 + y_offset**2)
-                            if dist <= lake_radius + random.uniform(-1, 1):
-                                lx, ly = center_x + x_offset, center_y + y_offset
-                                if 0 <= lx < GRID_WIDTH and 0 <= ly < GRID_HEIGHT:
-                                    if self.grid[ly][lx] != HOUSE:
-                                        self.grid[ly][lx] = WATER
+                    # NEW: Rasterize the whole lake disc (with a jittered edge) at once, clipped to the grid
+                    y0, y1 = max(0, center_y - lake_radius), min(GRID_HEIGHT, center_y + lake_radius + 1)
+                    x0, x1 = max(0, center_x - lake_radius), min(GRID_WIDTH, center_x + lake_radius + 1)
+                    y_offset, x_offset = np.ogrid[y0 - center_y:y1 - center_y, x0 - center_x:x1 - center_x]
+                    dist = np.hypot(x_offset, y_offset)
+                    lake = dist <= lake_radius + np.random.uniform(-1, 1, size=dist.shape)
+                    area = self.grid[y0:y1, x0:x1]
+                    area[lake & (area != HOUSE)] = WATER
                     break
 
     def setup_game(self):
-        self.total_burnable = sum(1 for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH) if self.grid[y][x] != WATER)
+        self.total_burnable = int(np.count_nonzero(self.grid != WATER)) # NEW: Counted over the whole grid at once
         
         # NEW: Set fire spread delay based on difficulty
         if self.difficulty == "Easy":
@@ -897,85 +1648,79 @@ class FireGame:
                 elif side == 2: sx, sy = random.randint(0, GRID_WIDTH - 1), GRID_HEIGHT - 1
                 else: sx, sy = 0, random.randint(0, GRID_HEIGHT - 1)
                 
-                if FLAMMABILITY.get(self.grid[sy][sx], 0) > 0 and self.grid[sy][sx] != FIRE:
-                    self.grid[sy][sx] = FIRE
+                if FLAMMABILITY_LUT[self.grid[sy, sx]] > 0 and self.grid[sy, sx] != FIRE:
+                    self.grid[sy, sx] = FIRE
                     for _ in range(random.randint(1, 3)):
                         fx, fy = max(0, min(GRID_WIDTH-1, sx+random.randint(-1,1))), max(0, min(GRID_HEIGHT-1, sy+random.randint(-1,1)))
-                        if self.grid[fy][fx] not in [WATER, FIRE, BURNT] and FLAMMABILITY.get(self.grid[fy][fx], 0) > 0:
-                            self.grid[fy][fx] = FIRE
+                        if IS_BURNABLE[self.grid[fy, fx]]:
+                            self.grid[fy, fx] = FIRE
                     found_start = True
                     break
             if not found_start:
                 print("Warning: Could not find a suitable second fire start location.")
 
-    def get_neighbors(self, x, y):
-        neighbors = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0: continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-                    neighbors.append((nx, ny))
-        return neighbors
     def spread_fire(self):
-        new_fires = []
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] == FIRE:
-                    for nx, ny in self.get_neighbors(x, y):
-                        terrain = self.grid[ny][nx]
-                        if terrain not in [FIRE, BURNT, CONTROLLED_BURN, WATER]:
-                            if random.random() < FLAMMABILITY[terrain] * 0.39: # Increased from 0.325 to further increase spread by ~20%
-                                new_fires.append((nx, ny))
-        for x, y in new_fires:
-            self.grid[y][x] = FIRE
-            self.burnt_timers[y][x] = 0 # NEW: Reset timer for new fires
-        return len(new_fires) > 0
+        # NEW: Vectorized over the whole grid. Every burning neighbor gets its own ignition roll,
+        # so a cell with n burning neighbors catches fire with probability 1 - (1 - p)^n.
+        if NUMBA_AVAILABLE:
+            rand_buf = np.random.random(self.grid.shape).astype(np.float32)
+            return step_fire(self.grid, self.burnt_timers, FLAMMABILITY_LUT, FIRE_SPREAD_CHANCE, rand_buf) > 0
+
+        fire_neighbors = count_neighbors(self.grid == FIRE)
+        can_ignite = (fire_neighbors > 0) & IS_BURNABLE[self.grid]
+        spread_chance = FLAMMABILITY_LUT[self.grid] * FIRE_SPREAD_CHANCE
+        ignite_chance = 1.0 - (1.0 - spread_chance) ** fire_neighbors
+        new_fires = can_ignite & (np.random.random(self.grid.shape) < ignite_chance)
+        self.grid[new_fires] = FIRE
+        self.burnt_timers[new_fires] = 0 # NEW: Reset timer for new fires
+        return bool(new_fires.any())
     def start_controlled_burn(self, x, y):
         if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT): return
-        terrain = self.grid[y][x]
-        if terrain not in [FIRE, BURNT, CONTROLLED_BURN, WATER, HOUSE]:
-            self.grid[y][x] = CONTROLLED_BURN
+        terrain = self.grid[y, x]
+        if IS_BURNABLE[terrain] and terrain != HOUSE:
+            self.grid[y, x] = CONTROLLED_BURN
             self.controlled_burns_used += 1
-            burn_queue, burn_size = [(x, y)], random.randint(10, 20)
+            burn_queue, burn_size = deque([(x, y)]), random.randint(10, 20)
+            # NEW: Gather the flammability field and the cells the burn may spread into (burnable, but never
+            # houses) once; cells the burn converts are cleared from the mask as it goes
+            flammability = FLAMMABILITY_LUT[self.grid]
+            can_burn = IS_BURNABLE[self.grid] & (self.grid != HOUSE)
             while burn_queue and burn_size > 0:
-                cx, cy = burn_queue.pop(0)
-                for nx, ny in self.get_neighbors(cx, cy):
-                    n_terrain = self.grid[ny][nx]
-                    if (n_terrain not in [FIRE, BURNT, CONTROLLED_BURN, WATER, HOUSE] and random.random() < FLAMMABILITY[n_terrain] * 0.4 and burn_size > 0):
-                        self.grid[ny][nx] = CONTROLLED_BURN
+                cx, cy = burn_queue.popleft()
+                for dx, dy in NEIGHBOR_OFFSETS:
+                    nx, ny = cx + dx, cy + dy
+                    if not (0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT): continue
+                    if (can_burn[ny, nx] and random.random() < flammability[ny, nx] * 0.4 and burn_size > 0):
+                        self.grid[ny, nx] = CONTROLLED_BURN
+                        can_burn[ny, nx] = False
                         burn_queue.append((nx, ny))
                         burn_size -= 1
     def update_controlled_burns(self, dt):
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] == CONTROLLED_BURN and random.random() < (0.2 * dt * 60): # Scale by dt * 60
-                    self.grid[y][x] = BURNT
+        # NEW: Whole-grid update; each controlled burn cell burns out with the same per-frame chance
+        burns_out = (self.grid == CONTROLLED_BURN) & (np.random.random(self.grid.shape) < (0.2 * dt * 60)) # Scale by dt * 60
+        self.grid[burns_out] = BURNT
+        self.ash_colors[burns_out] = np.random.randint(50, 71, size=np.count_nonzero(burns_out)) # NEW: Pick the ash shade now
     def age_fire(self, dt):
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] == FIRE:
-                    self.burnt_timers[y][x] += (self.dt * 60) # Scale by dt * 60
-                    if self.burnt_timers[y][x] >= MAX_ASH_TIMER:
-                        self.grid[y][x] = BURNT
-                        self.burnt_timers[y][x] = 0
-                        self.ash_colors[y][x] = random.randint(50, 70)
+        # NEW: Whole-grid update of every burning cell's timer
+        if NUMBA_AVAILABLE:
+            step_age_fire(self.grid, self.burnt_timers, self.ash_colors, np.float32(dt * 60))
+            return
+
+        fire = self.grid == FIRE
+        self.burnt_timers[fire] += (dt * 60) # Scale by dt * 60
+        burnt_out = fire & (self.burnt_timers >= MAX_ASH_TIMER)
+        self.grid[burnt_out] = BURNT
+        self.burnt_timers[burnt_out] = 0
+        self.ash_colors[burnt_out] = np.random.randint(50, 71, size=np.count_nonzero(burnt_out))
     def check_victory_condition(self):
-        has_fire, can_spread = False, False
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] == FIRE:
-                    has_fire = True
-                    for nx, ny in self.get_neighbors(x, y):
-                        if self.grid[ny][nx] not in [FIRE, BURNT, CONTROLLED_BURN, WATER] and FLAMMABILITY[self.grid[ny][nx]] > 0:
-                            can_spread = True
-                            break
-                if can_spread: break
+        # NEW: The fire is out once no cell is burning; checked over the whole grid at once
+        has_fire = (self.grid == FIRE).any()
         if not has_fire: self.victory = True; return True
         return False
     def calculate_stats(self):
-        houses_rem = sum(1 for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH) if self.grid[y][x] == HOUSE)
-        burnable_rem = sum(1 for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH) if self.grid[y][x] not in [WATER, FIRE, BURNT, CONTROLLED_BURN])
+        # NEW: Counted over the whole grid at once
+        houses_rem = int(np.count_nonzero(self.grid == HOUSE))
+        burnable_rem = int(np.count_nonzero(IS_BURNABLE[self.grid]))
         self.houses_saved = houses_rem
         if self.total_burnable > 0:
             self.forest_saved = (burnable_rem / self.total_burnable) * 100
@@ -1088,17 +1833,21 @@ class FireGame:
                     self._update_volume_from_slider(event.pos[0])
 
     def handle_3d_click(self, mouse_pos):
-        mv = np.array(glGetDoublev(GL_MODELVIEW_MATRIX)).reshape((4,4)).T
-        pr = np.array(glGetDoublev(GL_PROJECTION_MATRIX)).reshape((4,4)).T
-        inv_mat = np.linalg.inv(pr @ mv)
+        # NEW: The inverse view-projection only changes with the camera, so it is cached across clicks
+        camera = (self.camera_zoom, self.camera_rot_x, self.camera_rot_y)
+        if camera != self.click_unproject_camera:
+            # Built from the camera parameters rather than self.modelview, which only the next draw()
+            # updates, so a zoom or drag in the same event batch as the click is already included
+            view = camera_matrix(self.camera_zoom, self.camera_rot_x, self.camera_rot_y)
+            self.click_unproject = np.linalg.inv((view @ self.proj_matrix).T.astype(np.float64))
+            self.click_unproject_camera = camera
         mx, my = mouse_pos
-        ndc_x = (2.0 * mx) / WINDOW_WIDTH - 1.0
-        ndc_y = 1.0 - (2.0 * my) / WINDOW_HEIGHT
-        ndc_near = np.array([ndc_x, ndc_y, -1.0, 1.0])
-        ndc_far = np.array([ndc_x, ndc_y, 1.0, 1.0])
-        world_near = inv_mat @ ndc_near
+        ndc_x = (2.0 * mx) / self.window_size[0] - 1.0
+        ndc_y = 1.0 - (2.0 * my) / self.window_size[1]
+        # Unproject the near and far points of the ray in one product
+        world_near, world_far = (self.click_unproject @ np.array([[ndc_x, ndc_y, -1.0, 1.0],
+                                                                  [ndc_x, ndc_y, 1.0, 1.0]]).T).T
         world_near /= world_near[3]
-        world_far = inv_mat @ ndc_far
         world_far /= world_far[3]
         dir_vec = world_far[:3] - world_near[:3]
         if abs(dir_vec[1]) < 1e-6: return
@@ -1116,198 +1865,200 @@ class FireGame:
                 self.ignite_sound.set_volume(self.master_volume) # Use master volume for effect
                 self.ignite_sound.play()
 
-    def get_terrain_color(self, terrain_type, x, y):
-        # Use pre-calculated base color for terrain, or the default if not found
-        base_color = self.terrain_base_colors.get((x,y), BLACK)
-
-        if terrain_type == FIRE:
-            ash_color_base = 50
-            ash_color = (ash_color_base, ash_color_base, ash_color_base)
-            fade_factor = min(1.0, self.burnt_timers[y][x] / MAX_ASH_TIMER)
-            r = int(RED[0] * (1.0 - fade_factor) + ash_color[0] * fade_factor)
-            g = int(RED[1] * (1.0 - fade_factor) + ash_color[1] * fade_factor)
-            b = int(RED[2] * (1.0 - fade_factor) + ash_color[2] * fade_factor)
-            return (r, g, b)
-        elif terrain_type == BURNT:
-            if self.ash_colors[y][x] is None:
-                self.ash_colors[y][x] = random.randint(50, 70)
-            ash_value = self.ash_colors[y][x]
-            return (ash_value, ash_value, ash_value)
-        elif terrain_type == WATER: # Water always has a fixed color
-            return BLUE
-        elif terrain_type == HOUSE: # House always has a fixed color
-            return HOUSE_RED
-        elif terrain_type == CONTROLLED_BURN: # Controlled burn always has a fixed color
-            return ORANGE
-        
-        return base_color # For other terrain types (Forest, Grassland, Field), return the pre-calculated color
+    # NEW: Colors of the cells at the given flat grid indices, computed for all of them at once
+    def get_terrain_colors(self, cells):
+        terrain = self.grid.ravel()[cells]
+        colors = self.terrain_base_colors.reshape(-1, 3)[cells] # Pre-calculated color (Forest, Grassland, Field)
+        for terrain_type, color in ((WATER, BLUE), (HOUSE, HOUSE_RED), (CONTROLLED_BURN, ORANGE)): # Fixed colors
+            colors[terrain == terrain_type] = color
+
+        fire = terrain == FIRE
+        fade_factor = np.minimum(1.0, self.burnt_timers.ravel()[cells[fire]] / MAX_ASH_TIMER)
+        colors[fire] = FIRE_FADE_LUT[(fade_factor * 255).astype(np.intp)]
+
+        burnt = terrain == BURNT # Ash shades are picked when a cell burns out
+        colors[burnt] = self.ash_colors.ravel()[cells[burnt], None]
+        return colors
+
+    # NEW: Write new fire particles at world positions (x, z) into the next free rows,
+    # drawing all of their random attributes with one NumPy call per attribute
+    def spawn_particles(self, x, z):
+        count = min(len(x), MAX_PARTICLES - self.p_count)
+        if count <= 0:
+            return
+        rows = slice(self.p_count, self.p_count + count)
+        self.p_pos[rows, 0] = x[:count]
+        self.p_pos[rows, 1] = 0.5
+        self.p_pos[rows, 2] = z[:count]
+        self.p_vel[rows] = np.random.uniform((-0.02, 0.05, -0.02), (0.02, 0.1, 0.02), size=(count, 3))
+        self.p_life[rows] = self.p_max_life[rows] = np.random.randint(100, 201, size=count)
+        self.p_size[rows] = np.random.uniform(0.3, 0.6, size=count)
+        self.p_start_col[rows] = PARTICLE_START_COLORS[np.random.randint(len(PARTICLE_START_COLORS), size=count)]
+        self.p_count += count
 
     # NEW: Method to update and spawn particles
     def update_particles(self, dt):
-        # Update existing particles
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for p in self.particles:
-            p.update(dt)
+        step = dt * 60 # Frame-rate independent step, shared by every particle this frame
+        drag = 0.99 ** step # Slow down upward movement (gravity/drag) adjusted by dt
+
+        if NUMBA_AVAILABLE:
+            # NEW: Fused compaction + physics kernel
+            self.p_count = step_particles(self.p_pos, self.p_vel, self.p_life, self.p_max_life, self.p_size,
+                                          self.p_start_col, self.p_count, step, drag)
+        else:
+            # Remove dead particles by moving the live rows to the front of the arrays
+            live = np.flatnonzero(self.p_life[:self.p_count] > 0)
+            count = len(live)
+            if count < self.p_count:
+                for arr in (self.p_pos, self.p_vel, self.p_life, self.p_max_life, self.p_size, self.p_start_col):
+                    arr[:count] = arr[live]
+            self.p_count = count
+
+            # Update existing particles
+            self.p_pos[:count] += self.p_vel[:count] * step # Scale movement by dt
+            self.p_vel[:count, 1] *= drag
+            self.p_life[:count] -= step # Decrease lifetime by dt
 
         # Spawn new particles only from fire edge cells and at a reduced rate
         if not self.game_over:
-            for y in range(GRID_HEIGHT):
-                for x in range(GRID_WIDTH):
-                    if self.grid[y][x] == FIRE: # Check if it's a fire cell
-                        is_edge_cell = False
-                        for nx, ny in self.get_neighbors(x, y):
-                            # An edge cell is a fire cell next to a non-fire, non-burnt, non-water cell
-                            if self.grid[ny][nx] not in [FIRE, BURNT, WATER]:
-                                is_edge_cell = True
-                                break
-                        
-                        if is_edge_cell and random.random() < (0.03 * dt * 60): # Reduced spawn chance scaled by dt
-                            cx, cz = x - GRID_WIDTH / 2, y - GRID_HEIGHT / 2
-                            self.particles.append(Particle(cx, cz))
+            # NEW: An edge cell is a fire cell next to a non-fire, non-burnt, non-water cell; found for the whole grid at once
+            unburnt = ~np.isin(self.grid, (FIRE, BURNT, WATER))
+            edge = (self.grid == FIRE) & (count_neighbors(unburnt) > 0)
+            spawn_mask = edge & (np.random.random(self.grid.shape) < (0.03 * dt * 60)) # Reduced spawn chance scaled by dt
+            spawn_z, spawn_x = np.nonzero(spawn_mask)
+            self.spawn_particles(spawn_x - GRID_WIDTH / 2, spawn_z - GRID_HEIGHT / 2)
     
+    # NEW: Bring every sprite table in line with the grid. Sprite states only change when the cell
+    # under them does, so the grid checks are skipped on ticks where no cell changed state.
+    # NEW: Only the sprites standing on cells whose state changed since the last update are re-checked
+    def update_sprites(self, dt):
+        grid, sprite_grid = self.grid.ravel(), self.sprite_grid.ravel()
+        changed = np.flatnonzero(grid != sprite_grid)
+        sprite_grid[changed] = grid[changed]
+        self.update_trees(dt, changed)
+        if changed.size:
+            self.update_fieldgrass(changed)
+            self.update_houses(changed)
+
     ### NEW ###
     # Update tree animations based on grid state
-    def update_trees(self, dt):
+    def update_trees(self, dt, changed):
         # Constants for animation speed and frame counts
         ANIMATION_SPEED = 20  # Ticks per animation frame change
         BURNING_FRAMES_START = 1 # Index of first burning texture
         BURNING_FRAMES_END = 3   # Index of last burning texture
         BURNT_FRAME = 4          # Index of the final burnt texture
 
-        for tree in self.trees:
-            # Check the state of the ground beneath the tree
-            grid_state = self.grid[tree.grid_y][tree.grid_x]
-
-            # If tree is normal and ground catches fire, start burning
-            if tree.state == Tree.NORMAL and grid_state == FIRE:
-                tree.state = Tree.BURNING
-                tree.animation_timer = 0
-                tree.current_frame_index = BURNING_FRAMES_START
-
-            # If tree is burning, advance animation
-            elif tree.state == Tree.BURNING:
-                tree.animation_timer += (dt * 60) # Scale by dt
-                if tree.animation_timer >= ANIMATION_SPEED:
-                    tree.animation_timer = 0
-                    # Advance frame, but don't go past the last burning frame
-                    if tree.current_frame_index < BURNING_FRAMES_END:
-                        tree.current_frame_index += 1
-                
-                # If ground becomes burnt, tree becomes fully burnt too
-                if grid_state == BURNT:
-                    tree.state = Tree.BURNT
-                    tree.current_frame_index = BURNT_FRAME
+        burning = self.tree_state == Tree.BURNING
 
-            # If ground is burnt and tree wasn't already marked as such
-            elif tree.state != Tree.BURNT and grid_state == BURNT:
-                tree.state = Tree.BURNT
-                tree.current_frame_index = BURNT_FRAME
+        # If tree is burning, advance animation, but don't go past the last burning frame
+        self.tree_anim_timer[burning] += (dt * 60) # Scale by dt
+        next_frame = burning & (self.tree_anim_timer >= ANIMATION_SPEED)
+        self.tree_anim_timer[next_frame] = 0
+        self.tree_frame[next_frame] = np.minimum(self.tree_frame[next_frame] + 1, BURNING_FRAMES_END)
+        if not changed.size:
+            return
+
+        # Check the state of the ground beneath every tree on a changed cell at once
+        trees = sprites_on_cells(self.tree_lookup, changed)
+        grid_state = self.grid[self.tree_cell[trees, 1], self.tree_cell[trees, 0]]
+        tree_state = self.tree_state[trees]
+
+        # If ground is burnt and tree wasn't already marked as such, tree becomes fully burnt too
+        burnt = trees[(tree_state != Tree.BURNT) & (grid_state == BURNT)]
+        self.tree_state[burnt] = Tree.BURNT
+        self.tree_frame[burnt] = BURNT_FRAME
+
+        # If tree is normal and ground catches fire, start burning
+        ignite = trees[(tree_state == Tree.NORMAL) & (grid_state == FIRE)]
+        self.tree_state[ignite] = Tree.BURNING
+        self.tree_anim_timer[ignite] = 0
+        self.tree_frame[ignite] = BURNING_FRAMES_START
 
     ### NEW ###
     # Update field grass sprites based on grid state
-    def update_fieldgrass(self):
-        updated_grass_sprites = []
-        for fg in self.fieldgrass_sprites:
-            grid_state = self.grid[fg.grid_y][fg.grid_x]
-
-            # If ground is on fire or burnt, grass despawns (removed from list)
-            if grid_state == FIRE or grid_state == BURNT:
-                pass 
-            else: # Not fire or burnt, keep it as is
-                updated_grass_sprites.append(fg)
-        self.fieldgrass_sprites = updated_grass_sprites
+    def update_fieldgrass(self, changed):
+        grass = sprites_on_cells(self.fieldgrass_lookup, changed)
+        grid_state = self.grid[self.fieldgrass_cell[grass, 1], self.fieldgrass_cell[grass, 0]]
+        # If ground is on fire or burnt, grass despawns (removed from the arrays)
+        despawn = grass[(grid_state == FIRE) | (grid_state == BURNT)]
+        if despawn.size:
+            keep = np.ones(len(self.fieldgrass_cell), dtype=np.bool_)
+            keep[despawn] = False
+            self.fieldgrass_pos = self.fieldgrass_pos[keep]
+            self.fieldgrass_wh = self.fieldgrass_wh[keep]
+            self.fieldgrass_cell = self.fieldgrass_cell[keep]
+            self.fieldgrass_lookup = cell_sprite_lookup(self.fieldgrass_cell) # Sprite indices shifted
 
     ### NEW ###
     # Update house sprites based on grid state
-    def update_houses(self):
-        for house_sprite in self.house_sprites:
-            grid_state = self.grid[house_sprite.grid_y][house_sprite.grid_x]
-            if grid_state == BURNT or grid_state == FIRE:
-                house_sprite.state = HouseSprite.BURNT
-            # Removed the else clause, so burnt houses stay burnt
+    def update_houses(self, changed):
+        houses = sprites_on_cells(self.house_lookup, changed)
+        grid_state = self.grid[self.house_cell[houses, 1], self.house_cell[houses, 0]]
+        # Burnt houses stay burnt
+        self.house_state[houses[(grid_state == BURNT) | (grid_state == FIRE)]] = HouseSprite.BURNT
 
     # NEW: Draw menu
+    # NEW: Draw the ground plane from its VBOs. Only cells whose state changed since the last upload,
+    # plus burning cells (their color fades with the timer), have their color recomputed and re-uploaded.
+    def draw_terrain(self):
+        grid = self.grid.ravel()
+        dirty = np.flatnonzero((grid != self.ground_grid) | (grid == FIRE))
+        cell_colors = self.get_terrain_colors(dirty)
+        changed = dirty[(cell_colors != self.ground_colors[dirty, 0]).any(axis=1)]
+        self.ground_grid[dirty] = grid[dirty]
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.ground_color_vbo)
+        if changed.size:
+            first, last = changed[0], changed[-1] + 1
+            self.ground_colors[dirty] = cell_colors[:, None, :]
+            glBufferSubData(GL_ARRAY_BUFFER, int(first) * 12, self.ground_colors[first:last])
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(3, GL_UNSIGNED_BYTE, 0, ctypes.c_void_p(0))
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.ground_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+
+        self.bind_quad_indices(GRID_HEIGHT * GRID_WIDTH)
+        glDrawElements(GL_TRIANGLES, GRID_HEIGHT * GRID_WIDTH * 6, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
     def draw_menu(self):
         # --- NEW: Apply PSX effect to menu background if enabled ---
-        if self.psx_effect_enabled:
-            glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
-            glViewport(0, 0, self.fbo_width, self.fbo_height)
-        
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        self.begin_psx_pass()
         
         # Draw rotating terrain
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        glTranslatef(0.0, 0.0, -80.0) # Moved menu camera closer to spinning terrain
-        glRotatef(30, 1, 0, 0)  # Fixed X rotation
-        glRotatef(self.menu_rotation, 0, 1, 0)  # Rotating Y
+        # Camera moved closer to spinning terrain, fixed X rotation, rotating Y
+        self.modelview = camera_matrix(-80.0, 30, self.menu_rotation)
+        glLoadMatrixf(self.modelview)
         
         # Draw terrain (same as game)
         glDisable(GL_LIGHTING)
-        glBegin(GL_QUADS)
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                terrain = self.grid[y][x]
-                color = self.get_terrain_color(terrain, x, y)
-                glColor3f(color[0] / 255.0, color[1] / 255.0, color[2] / 255.0)
-                cx, cz = x - GRID_WIDTH / 2, y - GRID_HEIGHT / 2
-                glVertex3f(cx, 0, cz)
-                glVertex3f(cx + 1, 0, cz)
-                glVertex3f(cx + 1, 0, cz + 1)
-                glVertex3f(cx, 0, cz + 1)
-        glEnd()
+        self.draw_terrain()
 
         # Draw billboarded sprites
         self.draw_billboard_sprites()
         
         # --- NEW: Render FBO texture to screen if PSX effect is enabled ---
-        if self.psx_effect_enabled:
-            glBindFramebuffer(GL_FRAMEBUFFER, 0) # Bind back to default framebuffer
-            glViewport(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT) # Restore original viewport
-
-            # No need to clear here as the next draw will cover the entire screen.
-            # glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT) 
-
-            glMatrixMode(GL_PROJECTION)
-            glPushMatrix()
-            glLoadIdentity()
-            gluOrtho2D(0, WINDOW_WIDTH, WINDOW_HEIGHT, 0) # Set up 2D orthographic projection
-            glMatrixMode(GL_MODELVIEW)
-            glPushMatrix()
-            glLoadIdentity()
-
-            glDisable(GL_LIGHTING) # No lighting for 2D quad
-            glDisable(GL_DEPTH_TEST) # No depth testing for 2D quad
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.fbo_texture)
-            glColor4f(1.0, 1.0, 1.0, 1.0) # Ensure full white color to see texture as is
-
-            glBegin(GL_QUADS)
-            glTexCoord2f(0, 1); glVertex2f(0, 0) # Top-left of quad maps to bottom-left of texture
-            glTexCoord2f(1, 1); glVertex2f(WINDOW_WIDTH, 0)
-            glTexCoord2f(1, 0); glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-            glTexCoord2f(0, 0); glVertex2f(0, WINDOW_HEIGHT)
-            glEnd()
-
-            glDisable(GL_TEXTURE_2D)
-            glEnable(GL_DEPTH_TEST)
-            glEnable(GL_LIGHTING)
-
-            glMatrixMode(GL_PROJECTION)
-            glPopMatrix()
-            glMatrixMode(GL_MODELVIEW)
-            glPopMatrix()
+        self.end_psx_pass()
 
         # Draw menu UI overlay (always on top)
+        self.begin_2d()
         self.draw_menu_ui()
+        self.end_2d()
 
-    # NEW: Draw menu UI overlay
-    def draw_menu_ui(self):
+    # NEW: Start a 2D overlay pass: screen-space projection, no lighting or depth test, alpha blending.
+    # All overlays of a frame are drawn inside one pass, so this state is set up and restored once per frame.
+    def begin_2d(self):
         glMatrixMode(GL_PROJECTION)
         glPushMatrix()
-        glLoadIdentity()
-        current_size = pygame.display.get_surface().get_size()
-        gluOrtho2D(0, current_size[0], current_size[1], 0)
+        glLoadMatrixf(self.ui_matrix)
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
         glLoadIdentity()
@@ -1315,7 +2066,23 @@ class FireGame:
         glDisable(GL_DEPTH_TEST)
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        
+
+    # NEW: End the 2D overlay pass and restore the 3D state
+    def end_2d(self):
+        glDisable(GL_BLEND)
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_LIGHTING)
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopMatrix()
+
+    # NEW: Draw menu UI overlay (inside a 2D pass) from its pre-rendered overlay
+    def draw_menu_ui(self):
+        key = (self.menu_fade_alpha, self.psx_effect_enabled, self.difficulty, tuple(button.hovered for button in self.menu_buttons))
+        self.draw_overlay(self.menu_overlay, key, self.draw_menu_ui_contents)
+
+    def draw_menu_ui_contents(self, current_size):
         # Draw title
         if self.title_texture and self.title_texture[0]: # Check if texture_id exists
             title_id, title_original_width, title_original_height = self.title_texture
@@ -1345,17 +2112,7 @@ class FireGame:
         glColor4f(1.0, 1.0, 1.0, self.menu_fade_alpha / 255.0)
         
         # Draw all menu buttons (backgrounds and text)
-        all_menu_buttons = [
-            self.start_button,
-            self.fullscreen_button,
-            self.quit_button,
-            self.easy_button,
-            self.normal_button,
-            self.hard_button,
-            self.psx_effect_button_menu
-        ]
-
-        for button in all_menu_buttons:
+        for button in self.menu_buttons:
             is_selected = False
             if button == self.psx_effect_button_menu:
                 is_selected = self.psx_effect_enabled
@@ -1367,46 +2124,24 @@ class FireGame:
                 is_selected = (self.difficulty == "Hard")
             
             button.draw_gl(button.rect.x, button.rect.y, is_selected=is_selected)
-        
-        # Restore OpenGL state
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
 
-    # NEW: Draw fade overlay (placeholder as not explicitly provided)
+    # NEW: Draw fade overlay (placeholder as not explicitly provided), inside a 2D pass
     def draw_fade_overlay(self):
-        current_size = pygame.display.get_surface().get_size()
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, current_size[0], current_size[1], 0)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
+        current_size = self.window_size
         glColor4f(0.0, 0.0, 0.0, self.menu_fade_alpha / 255.0) # Black overlay fading out
-        
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(current_size[0], 0)
-        glVertex2f(current_size[0], current_size[1])
-        glVertex2f(0, current_size[1])
-        glEnd()
-        
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        self.fill_rect(0, 0, current_size[0], current_size[1])
+
+    # NEW: Fill a screen rectangle with the current color by scaling the static unit quad, inside a 2D pass
+    def fill_rect(self, x, y, width, height):
+        glPushMatrix()
+        glTranslatef(x, y, 0)
+        glScalef(width, height, 1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.quad_corner_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glDrawArrays(GL_TRIANGLE_FAN, 0, 4)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
         glPopMatrix()
 
     # MODIFIED: Update main update method
@@ -1422,9 +2157,7 @@ class FireGame:
                 self.menu_rotation -= 360
             
             # Update sprites for visual effect
-            self.update_trees(dt)
-            self.update_fieldgrass()
-            self.update_houses()
+            self.update_sprites(dt)
             
         elif self.game_state == GAME_STATE:
             # Handle menu fade transition (unfade from black)
@@ -1440,8 +2173,7 @@ class FireGame:
                 if self.fire_spread_timer >= self.fire_spread_delay:
                     self.fire_spread_timer = 0
                     still_spreading = self.spread_fire()
-                    burnable_left = sum(1 for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH) 
-                                      if self.grid[y][x] not in [WATER, FIRE, BURNT, CONTROLLED_BURN])
+                    burnable_left = int(np.count_nonzero(IS_BURNABLE[self.grid])) # NEW: One pass over the whole grid
                     if burnable_left < self.total_burnable * 0.15:
                         self.game_over = True
                         self.victory = False
@@ -1452,34 +2184,25 @@ class FireGame:
             
             # Always update visual elements
             self.update_particles(dt)
-            self.update_trees(dt)
-            self.update_fieldgrass()
-            self.update_houses()
+            self.update_sprites(dt)
 
             # NEW: Dynamic fire sound volume control
             if self.fire_sound:
                 # Get camera position from modelview matrix
-                modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
+                modelview = self.modelview
                 # The camera's position is the inverse of the translation part of the modelview matrix
                 # This extracts the camera's X, Y, Z coordinates in world space
                 camera_pos = np.array([-modelview[3][0], -modelview[3][1], -modelview[3][2]])
                 
+                # NEW: Count the burning cells and find the closest one for the whole grid at once.
+                # Distances use the cell centers in world space, and only X and Z (horizontal distance on the map).
+                fire_z, fire_x = np.nonzero(self.grid == FIRE)
+                active_fire_cells = len(fire_x)
                 closest_fire_distance = float('inf')
-                active_fire_cells = 0 # Initialize active fire cells count outside the loop
-
-                # Iterate through grid to find burning cells and closest fire
-                for y in range(GRID_HEIGHT):
-                    for x in range(GRID_WIDTH):
-                        if self.grid[y][x] == FIRE: # Check if this cell is on fire
-                            active_fire_cells += 1 # Count fire cells
-                            # Calculate world coordinates of the center of the fire cell
-                            fire_world_x = x - GRID_WIDTH / 2 + 0.5
-                            fire_world_z = y - GRID_HEIGHT / 2 + 0.5
-                            
-                            # Calculate distance from camera to this fire cell
-                            # We only care about X and Z for horizontal distance on the map
-                            dist = math.sqrt((camera_pos[0] - fire_world_x)**2 + (camera_pos[2] - fire_world_z)**2)
-                            closest_fire_distance = min(closest_fire_distance, dist)
+                if active_fire_cells:
+                    dx = fire_x - (GRID_WIDTH / 2 - 0.5) - camera_pos[0]
+                    dz = fire_z - (GRID_HEIGHT / 2 - 0.5) - camera_pos[2]
+                    closest_fire_distance = math.sqrt((dx * dx + dz * dz).min())
 
                 # Calculate distance-based volume factor
                 distance_factor = 0.0
@@ -1494,7 +2217,12 @@ class FireGame:
 
                 # Combine all factors for the final volume
                 final_volume = distance_factor * fire_presence_factor * MAX_FIRE_VOLUME * self.master_volume
-                self.fire_sound.set_volume(max(0.0, min(1.0, final_volume))) # Clamp between 0 and 1
+                final_volume = max(0.0, min(1.0, final_volume)) # Clamp between 0 and 1
+                # NEW: The mixer only has 128 volume steps, so skip the call unless the step changes
+                level = int(final_volume * 128)
+                if level != self.fire_sound_level:
+                    self.fire_sound.set_volume(final_volume)
+                    self.fire_sound_level = level
 
     # MODIFIED: Update main draw method
     def draw(self):
@@ -1502,78 +2230,31 @@ class FireGame:
             self.draw_menu()
         else: # This now covers GAME_STATE and PAUSED_STATE
             # --- DRAW THE MAIN GAME SCENE --- Before drawing anything, check if PSX effect is enabled.
-            if self.psx_effect_enabled:
-                glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
-                glViewport(0, 0, self.fbo_width, self.fbo_height)
-                
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+            self.begin_psx_pass()
             glMatrixMode(GL_MODELVIEW)
-            glLoadIdentity()
-            glTranslatef(0.0, 0.0, self.camera_zoom)
-            glRotatef(self.camera_rot_x, 1, 0, 0)
-            glRotatef(self.camera_rot_y, 0, 1, 0)
+            self.modelview = camera_matrix(self.camera_zoom, self.camera_rot_x, self.camera_rot_y)
+            glLoadMatrixf(self.modelview)
             
             # Draw terrain and sprites (existing code)
             glDisable(GL_LIGHTING) # Disable lighting for the terrain
-            glBegin(GL_QUADS)
-            for y in range(GRID_HEIGHT):
-                for x in range(GRID_WIDTH):
-                    terrain = self.grid[y][x]
-                    color = self.get_terrain_color(terrain, x, y)
-                    glColor3f(color[0] / 255.0, color[1] / 255.0, color[2] / 255.0)
-                    cx, cz = x - GRID_WIDTH / 2, y - GRID_HEIGHT / 2
-                    glVertex3f(cx, 0, cz)
-                    glVertex3f(cx + 1, 0, cz)
-                    glVertex3f(cx + 1, 0, cz + 1)
-                    glVertex3f(cx, 0, cz + 1)
-            glEnd()
+            self.draw_terrain()
             glEnable(GL_LIGHTING) # Re-enable lighting for other objects
 
             self.draw_billboard_sprites()
             self.draw_particles()
             
             # --- NEW: Render FBO texture to screen if PSX effect is enabled ---
-            if self.psx_effect_enabled:
-                glBindFramebuffer(GL_FRAMEBUFFER, 0) # Bind back to default framebuffer
-                glViewport(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT) # Restore original viewport
-
-                glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT) # Clear the default framebuffer
-                glMatrixMode(GL_PROJECTION)
-                glPushMatrix()
-                glLoadIdentity()
-                gluOrtho2D(0, WINDOW_WIDTH, WINDOW_HEIGHT, 0) # Set up 2D orthographic projection
-                glMatrixMode(GL_MODELVIEW)
-                glPushMatrix()
-                glLoadIdentity()
-
-                glDisable(GL_LIGHTING) # No lighting for 2D quad
-                glDisable(GL_DEPTH_TEST) # No depth testing for 2D quad
-                glEnable(GL_TEXTURE_2D)
-                glBindTexture(GL_TEXTURE_2D, self.fbo_texture)
-                glColor4f(1.0, 1.0, 1.0, 1.0) # Ensure full white color to see texture as is
-
-                glBegin(GL_QUADS)
-                glTexCoord2f(0, 1); glVertex2f(0, 0) # Top-left of quad maps to bottom-left of texture
-                glTexCoord2f(1, 1); glVertex2f(WINDOW_WIDTH, 0)
-                glTexCoord2f(1, 0); glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-                glTexCoord2f(0, 0); glVertex2f(0, WINDOW_HEIGHT)
-                glEnd()
-
-                glDisable(GL_TEXTURE_2D)
-                glEnable(GL_DEPTH_TEST)
-                glEnable(GL_LIGHTING)
-
-                glMatrixMode(GL_PROJECTION)
-                glPopMatrix()
-                glMatrixMode(GL_MODELVIEW)
-                glPopMatrix()
+            self.end_psx_pass()
 
+            # NEW: The pause menu and the regular UI share one 2D pass
+            self.begin_2d()
             # --- NEW: DRAW PAUSE MENU ON TOP IF PAUSED ---
             if self.game_state == PAUSED_STATE:
                 self.draw_pause_menu()
             
             # Draw the regular UI (score, etc.)
             self.draw_ui_gl()
+            self.end_2d()
 
         pygame.display.flip()
 
@@ -1591,14 +2272,12 @@ class FireGame:
         entire application, preserving window and fullscreen settings.
         """
         # Reset game logic variables
-        self.grid = [[FOREST_DENSE for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.burnt_timers = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.ash_colors = [[None for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        self.reset_grids()
         self.game_over = False
         self.victory = False
         self.fire_spread_timer = 0
         self.controlled_burns_used = 0
-        self.particles = []
+        self.p_count = 0
 
         # Regenerate the entire world
         # This automatically clears and repopulates houses, trees, etc.
@@ -1610,17 +2289,21 @@ class FireGame:
         # Ensure we are in the game state
         self.game_state = GAME_STATE
 
+    # NEW: Clear the cell grids in place for a new map instead of reallocating them
+    def reset_grids(self):
+        self.grid.fill(FOREST_DENSE)
+        self.burnt_timers.fill(0)
+        self.ash_colors.fill(0)
+
     # NEW: Method to reset game state and prepare for main menu without re-initializing Pygame display
     def reset_for_menu(self):
         # Reset game logic variables to initial menu state
-        self.grid = [[FOREST_DENSE for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.burnt_timers = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.ash_colors = [[None for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        self.reset_grids()
         self.game_over = False
         self.victory = False
         self.fire_spread_timer = 0
         self.controlled_burns_used = 0
-        self.particles = []
+        self.p_count = 0
         self.houses_saved = 0
         self.houses_total = 0
         self.forest_saved = 0
@@ -1636,6 +2319,8 @@ class FireGame:
         self.menu_rotation = 0 # Reset menu rotation
 
         # Ensure UI elements are re-initialized for the menu (if necessary, though init_menu_buttons is called in __init__)
+        for button in self.menu_buttons: # NEW: Free the label textures of the buttons being replaced
+            button.delete_texture()
         self.init_menu_buttons() # Re-create buttons to ensure correct state/positioning
 
         # NEW: Stop fire sound when returning to menu
@@ -1644,147 +2329,151 @@ class FireGame:
 
     # MODIFIED: Draw fullscreen button in game UI
     def draw_ui_gl(self):
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        current_size = pygame.display.get_surface().get_size()
-        gluOrtho2D(0, current_size[0], current_size[1], 0)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
-        def draw_text(x, y, text_surface):
-            text_data = pygame.image.tostring(text_surface, "RGBA", True)
-            glRasterPos2d(x, y + text_surface.get_height())
-            glDrawPixels(text_surface.get_width(), text_surface.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-
         if not self.game_over:
-            draw_text(10, 10, self.small_font.render("Drag to rotate, Scroll to zoom, Click to start controlled burn.", True, WHITE))
             stats = f"Burns: {self.controlled_burns_used} | Houses: {self.houses_saved}/{self.houses_total} | Forest: {self.forest_saved:.1f}% | Score: {self.score}"
-            draw_text(10, 30, self.small_font.render(stats, True, WHITE))
+            self.small_font_atlas.draw_lines(((10, 10, "Drag to rotate, Scroll to zoom, Click to start controlled burn."),
+                                              (10, 30, stats)))
         else:
             result_color = DARK_GREEN if self.victory else RED # Result text is DARK_GREEN for success, RED for failure
             result = f"SUCCESS! Houses saved: {self.houses_saved}/{self.houses_total}, Forest: {self.forest_saved:.1f}% | Score: {self.score}" if self.victory else f"FIRE SPREAD! Houses saved: {self.houses_saved}/{self.houses_total}, Forest: {self.forest_saved:.1f}% | Score: {self.score}"
-            draw_text(10, 10, self.font.render(result, True, result_color))
-            draw_text(10, 40, self.small_font.render("Press R to restart with new terrain", True, result_color))
+            self.font_atlas.draw(10, 10, result, result_color)
+            self.small_font_atlas.draw(10, 40, "Press R to restart with new terrain", result_color)
         
         # Add fullscreen button in top-right corner (Removed this text as per user request)
         # if not self.game_over:
         #     fs_text = "F11: Fullscreen" if not self.is_fullscreen else "F11: Windowed"
         #     current_size = pygame.display.get_surface().get_size()
-        #     draw_text(current_size[0] - 200, 10, 
-        #              self.small_font.render(fs_text, True, WHITE))
-
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
+        #     self.small_font_atlas.draw(current_size[0] - 200, 10, fs_text)
 
     # NEW: Method to draw particles as camera-facing billboards
     def draw_particles(self):
-        if not self.particles:
+        count = self.p_count
+        if count == 0:
             return
 
-        # --- VBO-BASED PARTICLE RENDERING ---
-
         # 1. Get camera vectors for billboard calculation
-        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
+        modelview = self.modelview
         camera_right = np.array([modelview[0][0], modelview[1][0], modelview[2][0]])
         camera_up = np.array([modelview[0][1], modelview[1][1], modelview[2][1]])
 
-        # 2. Create vertex and color data on the CPU (fast with numpy)
-        num_particles = len(self.particles)
-        # Each particle needs 4 vertices, each vertex has 3 components (x,y,z)
-        vertex_data = np.zeros((num_particles, 4, 3), dtype='f4')
-        # Each particle needs 4 vertices, each vertex has 4 components (r,g,b,a)
-        color_data = np.zeros((num_particles, 4, 4), dtype='f4')
-
-        for i, p in enumerate(self.particles):
-            p_pos = p.pos
-            half_size_right = camera_right * p.size / 2
-            half_size_up = camera_up * p.size / 2
-            
-            # Calculate the 4 corners of the billboard
-            v1 = p_pos - half_size_right - half_size_up
-            v2 = p_pos + half_size_right - half_size_up
-            v3 = p_pos + half_size_right + half_size_up
-            v4 = p_pos - half_size_right + half_size_up
-            
-            vertex_data[i] = v1, v2, v3, v4
-            color_data[i,:] = p.get_color() # Assign color to all 4 vertices
+        # 2. Fade from start color to end color, alpha fades out; packed into RGBA bytes
+        fade_factor = self.p_life[:count] / self.p_max_life[:count]
+        colors = np.empty((count, 4), dtype=np.float32)
+        colors[:, :3] = self.p_start_col[:count] * fade_factor[:, None] + PARTICLE_END_COLOR * (1 - fade_factor[:, None])
+        colors[:, 3] = fade_factor
+        colors = (colors * 255 + 0.5).astype(np.uint8)
 
-        # 3. Send data to GPU
-        # Bind the vertex VBO and upload the data
-        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo_v)
-        glBufferData(GL_ARRAY_BUFFER, vertex_data.nbytes, vertex_data, GL_STREAM_DRAW)
-        
-        # Bind the color VBO and upload the data
-        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo_c)
-        glBufferData(GL_ARRAY_BUFFER, color_data.nbytes, color_data, GL_STREAM_DRAW)
-        
-        # 4. Set up OpenGL state for drawing from arrays
+        # 3. Set up OpenGL state for drawing from arrays
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glDepthMask(GL_FALSE)
         glDisable(GL_LIGHTING) # Particles should not be lit
 
-        # Enable array pointers
+        # 4. Draw everything with a single command!
+        if self.particle_program:
+            self.draw_particles_instanced(count, colors, camera_right, camera_up)
+        else:
+            self.draw_particle_quads(count, colors, camera_right, camera_up)
+
+        # 5. Clean up state
+        glEnable(GL_LIGHTING)
+        glDepthMask(GL_TRUE)
+        glDisable(GL_BLEND)
+
+    # NEW: Upload one point per particle and let the vertex shader expand it into a quad
+    def draw_particles_instanced(self, count, colors, camera_right, camera_up):
+        instances = self.particle_instances[:count]
+        instances['pos'][:, 0:3] = self.p_pos[:count]
+        instances['pos'][:, 3] = self.p_size[:count]
+        instances['color'] = colors
+        glBindBuffer(GL_ARRAY_BUFFER, self.particle_instance_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, instances.nbytes, instances)
+
+        glUseProgram(self.particle_program)
+        glUniform3f(self.particle_camera_right, *camera_right)
+        glUniform3f(self.particle_camera_up, *camera_up)
+        position, color = self.particle_attribs
+        glEnableVertexAttribArray(position)
+        glVertexAttribPointer(position, 4, GL_FLOAT, GL_FALSE, 20, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(color)
+        glVertexAttribPointer(color, 4, GL_UNSIGNED_BYTE, GL_TRUE, 20, ctypes.c_void_p(16))
+        for location in self.particle_attribs:
+            glVertexAttribDivisor(location, 1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.quad_corner_vbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+
+        glDrawArraysInstanced(GL_TRIANGLE_FAN, 0, 4, count)
+
+        glDisableVertexAttribArray(0)
+        for location in self.particle_attribs:
+            glVertexAttribDivisor(location, 0)
+            glDisableVertexAttribArray(location)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    # NEW: Build every particle quad on the CPU into the preallocated vertex buffer and draw them from the VBO
+    def draw_particle_quads(self, count, colors, camera_right, camera_up):
+        pos = self.p_pos[:count]
+        half_size = self.p_size[:count, None] / 2
+        half_size_right = camera_right * half_size
+        half_size_up = camera_up * half_size
+
+        vertex_data = self.particle_buffer[:count]
+        vertex_pos = vertex_data['pos']
+        vertex_pos[:, 0] = pos - half_size_right - half_size_up
+        vertex_pos[:, 1] = pos + half_size_right - half_size_up
+        vertex_pos[:, 2] = pos + half_size_right + half_size_up
+        vertex_pos[:, 3] = pos - half_size_right + half_size_up
+        vertex_data['color'] = colors[:, None, :] # Same color for all 4 vertices
+
+        # Send data to GPU, reusing the VBO storage allocated in __init__
+        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertex_data.nbytes, vertex_data)
+
+        # Point to the interleaved data in the VBO (16 bytes per vertex)
         glEnableClientState(GL_VERTEX_ARRAY)
         glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 16, ctypes.c_void_p(0))
+        glColorPointer(4, GL_UNSIGNED_BYTE, 16, ctypes.c_void_p(12))
 
-        # Point to the data in the VBOs
-        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo_v)
-        glVertexPointer(3, GL_FLOAT, 0, None)
-        
-        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo_c)
-        glColorPointer(4, GL_FLOAT, 0, None)
-
-        # 5. Draw everything with a single command!
-        glDrawArrays(GL_QUADS, 0, num_particles * 4)
+        self.bind_quad_indices(count)
+        glDrawElements(GL_TRIANGLES, count * 6, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
 
-        # 6. Clean up state
         glDisableClientState(GL_COLOR_ARRAY)
         glDisableClientState(GL_VERTEX_ARRAY)
         glBindBuffer(GL_ARRAY_BUFFER, 0) # Unbind VBO
 
-        glEnable(GL_LIGHTING)
-        glDepthMask(GL_TRUE)
-        glDisable(GL_BLEND)
+    # NEW: Composite a pre-rendered overlay, re-rendering it first if `key` changed. Menus only change
+    # when the window, a hovered button or a setting changes, so most frames are a single blit.
+    def draw_overlay(self, overlay, key, render):
+        current_size = self.window_size
+        if not self.blit_program:
+            render(current_size)
+            return
 
-    # Add this new method to the FireGame class to draw the pause menu UI:
-    def draw_pause_menu(self):
-        current_size = pygame.display.get_surface().get_size()
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix(); glLoadIdentity()
-        gluOrtho2D(0, current_size[0], current_size[1], 0)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix(); glLoadIdentity()
-        
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
+        overlay.update((current_size, key), current_size, render)
+        glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA) # The cached colors are premultiplied by alpha
+        self.blit_texture(overlay.texture)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
+    # Add this new method to the FireGame class to draw the pause menu UI (inside a 2D pass):
+    # NEW: Drawn from its pre-rendered overlay
+    def draw_pause_menu(self):
+        buttons = (self.resume_button, self.restart_pause_button, self.main_menu_button,
+                   self.fullscreen_pause_button, self.psx_effect_button_pause)
+        key = (self.master_volume, self.is_fullscreen, self.psx_effect_enabled, tuple(button.hovered for button in buttons))
+        self.draw_overlay(self.pause_overlay, key, self.draw_pause_menu_contents)
+
+    def draw_pause_menu_contents(self, current_size):
         # Draw a semi-transparent dark overlay
         glColor4f(0.0, 0.0, 0.0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0); glVertex2f(current_size[0], 0)
-        glVertex2f(current_size[0], current_size[1]); glVertex2f(0, current_size[1])
-        glEnd()
+        self.fill_rect(0, 0, current_size[0], current_size[1])
 
         # Draw "PAUSED" text
-        paused_text = self.font.render("PAUSED", True, WHITE)
-        text_x = current_size[0] // 2 - paused_text.get_width() // 2
-        text_data = pygame.image.tostring(paused_text, "RGBA", True)
-        glRasterPos2d(text_x, 150 + paused_text.get_height())
-        glDrawPixels(paused_text.get_width(), paused_text.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        text_x = current_size[0] // 2 - self.font_atlas.text_width("PAUSED") // 2
+        self.font_atlas.draw(text_x, 150, "PAUSED")
         
         # Draw centered buttons and their text
         all_pause_buttons_centered = [
@@ -1813,47 +2502,32 @@ class FireGame:
         # NEW: Draw Volume Slider
         # Slider track
         glColor3f(0.3, 0.3, 0.3) # Dark gray track
-        glBegin(GL_QUADS)
-        glVertex2f(self.volume_slider_rect.x, self.volume_slider_rect.y)
-        glVertex2f(self.volume_slider_rect.x + self.volume_slider_rect.width, self.volume_slider_rect.y)
-        glVertex2f(self.volume_slider_rect.x + self.volume_slider_rect.width, self.volume_slider_rect.y + self.volume_slider_rect.height)
-        glVertex2f(self.volume_slider_rect.x, self.volume_slider_rect.y + self.volume_slider_rect.height)
-        glEnd()
+        self.fill_rect(*self.volume_slider_rect)
 
         # Current volume level indicator (brighter bar)
         glColor3f(0.8, 0.8, 0.0) # Yellowish indicator
-        glBegin(GL_QUADS)
-        glVertex2f(self.volume_slider_rect.x, self.volume_slider_rect.y)
-        glVertex2f(self.volume_slider_rect.x + self.volume_slider_rect.width * self.master_volume, self.volume_slider_rect.y)
-        glVertex2f(self.volume_slider_rect.x + self.volume_slider_rect.width * self.master_volume, self.volume_slider_rect.y + self.volume_slider_rect.height)
-        glVertex2f(self.volume_slider_rect.x, self.volume_slider_rect.y + self.volume_slider_rect.height)
-        glEnd()
+        self.fill_rect(self.volume_slider_rect.x, self.volume_slider_rect.y,
+                       self.volume_slider_rect.width * self.master_volume, self.volume_slider_rect.height)
 
         # Slider thumb (draggable part)
         thumb_x = self.volume_slider_rect.x + self.volume_slider_rect.width * self.master_volume
         thumb_y = self.volume_slider_rect.centery
         glColor3f(1.0, 1.0, 1.0) # White thumb
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex2f(thumb_x, thumb_y)
-        for i in range(20): # Draw a circle (approx. 20 segments)
-            angle = 2 * math.pi * i / 19
-            glVertex2f(thumb_x + math.cos(angle) * self.volume_slider_thumb_radius, thumb_y + math.sin(angle) * self.volume_slider_thumb_radius)
-        glEnd()
+        glPushMatrix()
+        glTranslatef(thumb_x, thumb_y, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, self.thumb_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glDrawArrays(GL_TRIANGLE_FAN, 0, len(THUMB_FAN))
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glPopMatrix()
 
         # Volume label
         volume_text = f"Volume: {int(self.master_volume * 100)}%"
-        volume_label_surf = self.small_font.render(volume_text, True, WHITE)
-        volume_label_x = self.volume_slider_rect.x + self.volume_slider_rect.width // 2 - volume_label_surf.get_width() // 2
-        volume_label_y = self.volume_slider_rect.y - volume_label_surf.get_height() - 5 # 5px above slider
-        text_data = pygame.image.tostring(volume_label_surf, "RGBA", True)
-        glRasterPos2d(volume_label_x, volume_label_y + volume_label_surf.get_height())
-        glDrawPixels(volume_label_surf.get_width(), volume_label_surf.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-
-        # Restore OpenGL state
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION); glPopMatrix()
-        glMatrixMode(GL_MODELVIEW); glPopMatrix()
+        volume_label_x = self.volume_slider_rect.x + self.volume_slider_rect.width // 2 - self.small_font_atlas.text_width(volume_text) // 2
+        volume_label_y = self.volume_slider_rect.y - self.small_font_atlas.height - 5 # 5px above slider
+        self.small_font_atlas.draw(volume_label_x, volume_label_y, volume_text)
 
     # NEW: Helper method to update master volume from slider position
     def _update_volume_from_slider(self, mouse_x):